@@ -2,21 +2,42 @@
 FastAPI dependencies for authentication, authorization, and common functionality.
 """
 
+import re
+from dataclasses import dataclass, field
 from typing import Optional
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy import select
+from sqlalchemy import select, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.postgres import get_db
+from graph.neo4j_client import Neo4jClient
 from models.user import User, UserRole
 from security.auth import jwt_manager, rbac_manager
-from security.audit import audit_logger
+from security.audit_batcher import audit_batcher
+from security.user_cache import (
+    CachedUser,
+    get_verified_token,
+    remember_verified_token,
+    forget_verified_token,
+    get_token_state,
+    is_token_revoked,
+    cache_user,
+)
 
 security = HTTPBearer()
 
+# Request paths that touch PHI; group 1 is the resource type
+PHI_PATH_RE = re.compile(r"/(patients|appointments|medical-history)(?:/|$)")
+
+# Upper bound on page size for list endpoints
+MAX_PER_PAGE = 100
+
+# Hot statement built once; executed with {"user_id": ...}
+USER_BY_ID = select(User).where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+
 
 async def get_current_user(
     request: Request,
@@ -37,8 +58,26 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    token = credentials.credentials
+    
+    # Tokens this worker verified recently skip signature and user lookups,
+    # but are still checked against the revocation set shared by all workers
+    verified = get_verified_token(token)
+    if verified:
+        jti, cached = verified
+        if jti and await is_token_revoked(jti):
+            forget_verified_token(token)
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = cached.to_user()
+        request.state.current_user = user
+        return user
+    
     # Verify token
-    payload = jwt_manager.verify_token(credentials.credentials)
+    payload = jwt_manager.verify_token(token)
     
     if not payload:
         raise HTTPException(
@@ -47,10 +86,24 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Check revocation and the shared user cache in one Redis round trip
+    jti = payload.get("jti")
+    if jti:
+        revoked, cached = await get_token_state(jti)
+        if revoked:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        if cached:
+            remember_verified_token(token, cached, payload["exp"], jti)
+            user = cached.to_user()
+            request.state.current_user = user
+            return user
+    
     # Get user from database
-    user_id = payload.get("sub")
-    query = select(User).where(User.id == user_id, User.deleted_at == None)
-    result = await db.execute(query)
+    result = await db.execute(USER_BY_ID, {"user_id": payload.get("sub")})
     user = result.scalar_one_or_none()
     
     if not user:
@@ -65,6 +118,11 @@ async def get_current_user(
             detail="User account is disabled"
         )
     
+    cached = CachedUser.model_validate(user)
+    remember_verified_token(token, cached, payload["exp"], jti)
+    if jti:
+        await cache_user(jti, cached, payload["exp"])
+    
     # Store user in request state for logging
     request.state.current_user = user
     
@@ -98,11 +156,14 @@ def require_role(*allowed_roles: UserRole):
     Returns:
         Dependency function
     """
+    allowed = frozenset(allowed_roles)
+    detail = f"Requires one of roles: {', '.join(r.value for r in allowed_roles)}"
+    
     async def role_checker(current_user: User = Depends(get_current_user)) -> User:
-        if current_user.role not in allowed_roles:
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Requires one of roles: {', '.join([r.value for r in allowed_roles])}"
+                detail=detail
             )
         return current_user
     
@@ -127,11 +188,13 @@ def require_permission(resource: str, action: str):
     Returns:
         Dependency function
     """
+    detail = f"Insufficient permissions for {action} on {resource}"
+    
     async def permission_checker(current_user: User = Depends(get_current_user)) -> User:
         if not rbac_manager.has_permission(current_user.role, resource, action):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Insufficient permissions for {action} on {resource}"
+                detail=detail
             )
         return current_user
     
@@ -140,10 +203,12 @@ def require_permission(resource: str, action: str):
 
 async def verify_clinic_access(
     clinic_id: UUID,
-    current_user: User = Depends(get_current_user)
+    current_user: User
 ) -> bool:
     """
     Verify user has access to specific clinic.
+    Called from handlers with the user already resolved by their
+    permission dependency, so authentication is not repeated.
     
     Args:
         clinic_id: Clinic ID to check
@@ -169,6 +234,18 @@ async def verify_clinic_access(
     return True
 
 
+def get_neo4j_client(request: Request) -> Neo4jClient:
+    """
+    Dependency for the shared Neo4j client created in the app lifespan.
+    One client per worker keeps a single driver pool and read cache.
+    Usage:
+        @router.get("/graph/...")
+        async def handler(graph: Neo4jClient = Depends(get_neo4j_client)):
+            ...
+    """
+    return request.app.state.neo4j_client
+
+
 async def log_request(
     request: Request,
     current_user: Optional[User] = None
@@ -185,31 +262,29 @@ async def log_request(
     user_agent = request.headers.get("user-agent")
     
     # Determine if this is PHI access
-    is_phi = any(path in str(request.url.path) for path in [
-        "/patients",
-        "/appointments",
-        "/medical-history"
-    ])
+    path = request.url.path
+    phi_match = PHI_PATH_RE.search(path)
     
     # Log the request
-    if current_user and is_phi:
-        await audit_logger.log_phi_access(
+    if current_user and phi_match:
+        audit_batcher.enqueue_phi_access(
             user_id=current_user.id,
             user_email=current_user.email,
             user_role=current_user.role.value,
             action=request.method,
-            resource_type=request.url.path.split("/")[3] if len(request.url.path.split("/")) > 3 else "unknown",
+            resource_type=phi_match.group(1),
             resource_id=None,  # Will be updated by endpoint if needed
             ip_address=client_ip,
             user_agent=user_agent,
             clinic_id=current_user.clinic_id,
             metadata={
-                "endpoint": str(request.url.path),
+                "endpoint": path,
                 "method": request.method
             }
         )
 
 
+@dataclass(slots=True)
 class PaginationParams:
     """
     Common pagination parameters.
@@ -221,30 +296,20 @@ class PaginationParams:
         ):
             offset = pagination.skip
             limit = pagination.limit
+    
+    Attributes:
+        page: Page number (1-indexed)
+        per_page: Items per page, clamped to MAX_PER_PAGE
     """
     
-    def __init__(
-        self,
-        page: int = 1,
-        per_page: int = 20,
-        max_per_page: int = 100
-    ):
-        """
-        Initialize pagination parameters.
-        
-        Args:
-            page: Page number (1-indexed)
-            per_page: Items per page
-            max_per_page: Maximum items per page
-        """
-        self.page = max(1, page)
-        self.per_page = min(max(1, per_page), max_per_page)
+    page: int = 1
+    per_page: int = 20
+    skip: int = field(init=False)
+    limit: int = field(init=False)
+    
+    def __post_init__(self) -> None:
+        """Clamp inputs and derive the query offset/limit."""
+        self.page = max(1, self.page)
+        self.per_page = min(max(1, self.per_page), MAX_PER_PAGE)
         self.skip = (self.page - 1) * self.per_page
         self.limit = self.per_page
-    
-    @property
-    def offset(self) -> int:
-        """Get offset for database query."""
-        return self.skip
-
-
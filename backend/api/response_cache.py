@@ -0,0 +1,130 @@
+"""
+Redis-backed cache for serialized JSON responses.
+Entries are grouped by namespace so writes can drop every cached variant at once.
+Keys embed the namespace's generation, which invalidation bumps, so a response
+rendered before a write but cached after it lands under a dead key.
+"""
+
+import hashlib
+import logging
+from typing import Optional
+
+from redis.exceptions import RedisError
+
+from database.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_PREFIX = "cache:"
+
+# Namespaces
+PATIENT_LIST_NAMESPACE = "patients:list"
+
+
+def _index_key(namespace: str) -> str:
+    """Redis set tracking the live keys of a namespace."""
+    return f"{RESPONSE_CACHE_PREFIX}{namespace}:keys"
+
+
+def _generation_key(namespace: str) -> str:
+    """Redis counter bumped on every invalidation of a namespace."""
+    return f"{RESPONSE_CACHE_PREFIX}{namespace}:generation"
+
+
+async def namespace_generation(namespace: str) -> Optional[int]:
+    """
+    Read a namespace's current generation. Read it before loading the data a
+    response is built from, and pass it to response_cache_key.
+
+    Args:
+        namespace: Cache namespace
+
+    Returns:
+        Generation number, None on Redis failure
+    """
+    try:
+        return int(await redis_client.get(_generation_key(namespace)) or 0)
+    except RedisError:
+        logger.warning("Response cache generation lookup failed", exc_info=True)
+        return None
+
+
+def response_cache_key(namespace: str, generation: Optional[int], *parts: object) -> Optional[str]:
+    """
+    Build a cache key from everything that shapes a response.
+
+    Args:
+        namespace: Cache namespace
+        generation: Result of namespace_generation
+        *parts: Caller scope and query parameters
+
+    Returns:
+        Redis key for the response, None (caching disabled) if the generation is unknown
+    """
+    if generation is None:
+        return None
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f"{RESPONSE_CACHE_PREFIX}{namespace}:{generation}:{digest}"
+
+
+async def get_cached_response(key: Optional[str]) -> Optional[str]:
+    """
+    Get a cached response body.
+
+    Args:
+        key: Key from response_cache_key
+
+    Returns:
+        JSON body, None on miss, disabled caching or Redis failure
+    """
+    if key is None:
+        return None
+    try:
+        return await redis_client.get(key)
+    except RedisError:
+        logger.warning("Response cache lookup failed", exc_info=True)
+        return None
+
+
+async def cache_response(namespace: str, key: Optional[str], body: str, ttl: int) -> None:
+    """
+    Cache a response body and register it under its namespace.
+
+    Args:
+        namespace: Cache namespace
+        key: Key from response_cache_key
+        body: JSON body
+        ttl: Seconds to keep the entry
+    """
+    if key is None:
+        return
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.setex(key, ttl, body)
+            pipe.sadd(_index_key(namespace), key)
+            pipe.expire(_index_key(namespace), ttl)
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Response cache write failed", exc_info=True)
+
+
+async def invalidate_namespace(namespace: str) -> None:
+    """
+    Drop every cached response in a namespace (e.g. after a write).
+
+    Args:
+        namespace: Cache namespace
+    """
+    index_key = _index_key(namespace)
+    try:
+        # Bumping the generation retires every key, including ones still being
+        # rendered; taking and resetting the index then frees the old entries
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(_generation_key(namespace))
+            pipe.smembers(index_key)
+            pipe.delete(index_key)
+            _, keys, _ = await pipe.execute()
+        if keys:
+            await redis_client.delete(*keys)
+    except RedisError:
+        logger.warning("Response cache invalidation failed", exc_info=True)
@@ -2,12 +2,12 @@
 Appointment management endpoints.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Request, Query, BackgroundTasks
-from sqlalchemy import select, and_, or_, func, text
+from sqlalchemy import select, insert, update, cast, true, and_, or_, func, text, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies import (
@@ -22,11 +22,75 @@ from models.appointment import Appointment, AppointmentStatus, AppointmentType
 from models.user import User, UserRole
 from models.patient import Patient
 from schemas.appointment import AppointmentCreate, AppointmentUpdate, AppointmentResponse, AppointmentListResponse
-from security.audit import audit_logger
+from security.audit_batcher import audit_batcher
 
 router = APIRouter()
 
 
+def _appointment_access(appointment_id: UUID, current_user: User) -> list:
+    """
+    WHERE criteria for a live appointment the user is allowed to see.
+    
+    Args:
+        appointment_id: Appointment ID
+        current_user: Current user
+        
+    Returns:
+        List of SQLAlchemy criteria
+    """
+    criteria = [Appointment.id == appointment_id, Appointment.deleted_at.is_(None)]
+    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
+        criteria.append(Appointment.clinic_id == current_user.clinic_id)
+    return criteria
+
+
+def _provider_criteria(appointment_id: UUID, current_user: User) -> list:
+    """Access criteria, further limited to the assigned provider unless the user is an admin."""
+    criteria = _appointment_access(appointment_id, current_user)
+    if current_user.role != UserRole.ADMIN:
+        criteria.append(Appointment.provider_id == current_user.id)
+    return criteria
+
+
+async def _raise_transition_error(
+    db: AsyncSession,
+    appointment_id: UUID,
+    current_user: User,
+    detail: str,
+    provider_detail: Optional[str] = None
+) -> None:
+    """
+    Explain why a guarded status UPDATE matched no rows.
+    Only runs on the failure path, so successful transitions stay one round-trip.
+    
+    Args:
+        db: Database session
+        appointment_id: Appointment ID
+        current_user: Current user
+        detail: Message for a transition not allowed from the current status
+        provider_detail: Message for a non-provider caller, for provider-only transitions
+    
+    Raises:
+        HTTPException: 404 if the appointment is not visible, 403 if the caller is not
+            the assigned provider, otherwise 400 (invalid transition)
+    """
+    row = (await db.execute(
+        select(Appointment.provider_id).where(*_appointment_access(appointment_id, current_user))
+    )).one_or_none()
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Appointment not found"
+        )
+    if (
+        provider_detail is not None
+        and current_user.role != UserRole.ADMIN
+        and row.provider_id != current_user.id
+    ):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=provider_detail)
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
 @router.get("", response_model=AppointmentListResponse)
 async def list_appointments(
     request: Request,
@@ -45,8 +109,8 @@ async def list_appointments(
     List appointments with filtering and pagination.
     """
 
-    # Build base query
-    query = select(Appointment).where(Appointment.deleted_at == None)
+    # Build base query (total row count rides along as a window function)
+    query = select(Appointment, func.count().over().label("total")).where(Appointment.deleted_at.is_(None))
 
     # Apply clinic access control
     if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
@@ -79,26 +143,25 @@ async def list_appointments(
     if date_to:
         query = query.where(Appointment.scheduled_end <= date_to)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query)
-    result = await db.execute(count_query)
-    total = result.scalar()
-
     # Apply pagination and ordering
-    query = query.order_by(Appointment.scheduled_start).offset(pagination.offset).limit(pagination.limit)
+    page_query = query.order_by(Appointment.scheduled_start).offset(pagination.skip).limit(pagination.limit)
 
     # Execute query
-    result = await db.execute(query)
-    appointments = result.scalars().all()
-
-    # Convert to response format
-    items = []
-    for appointment in appointments:
-        # Add computed properties
-        appointment_dict = appointment.__dict__.copy()
-        appointment_dict['can_check_in'] = appointment.can_check_in
-        appointment_dict['is_past'] = appointment.is_past
-        items.append(AppointmentResponse.model_validate(appointment_dict))
+    result = await db.execute(page_query)
+    rows = result.all()
+    appointments = [row.Appointment for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif pagination.page > 1:
+        # Past the last page: no rows to carry the window count
+        count_query = select(func.count()).select_from(query.with_only_columns(Appointment.id).subquery())
+        total = (await db.execute(count_query)).scalar()
+    else:
+        total = 0
+
+    # Convert to response format (can_check_in / is_past read from model properties)
+    items = [AppointmentResponse.model_validate(appointment) for appointment in appointments]
 
     return AppointmentListResponse(
         items=items,
@@ -123,40 +186,19 @@ async def create_appointment(
     # Verify clinic access
     await verify_clinic_access(appointment_data.clinic_id, current_user)
 
-    # Verify patient exists and user has access
-    patient_result = await db.execute(
-        select(Patient).where(
-            and_(Patient.id == appointment_data.patient_id, Patient.deleted_at == None)
-        )
+    # Access-scoped existence checks for patient and provider
+    patient_query = select(Patient.id).where(
+        and_(Patient.id == appointment_data.patient_id, Patient.deleted_at.is_(None))
     )
-    if current_user.role != UserRole.ADMIN:
-        patient_result = patient_result.where(Patient.primary_clinic_id == current_user.clinic_id)
-
-    patient = patient_result.scalar_one_or_none()
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient not found or access denied"
-        )
-
-    # Verify provider exists and has access to clinic
-    provider_result = await db.execute(
-        select(User).where(
-            and_(User.id == appointment_data.provider_id, User.deleted_at == None)
-        )
+    provider_query = select(User.id).where(
+        and_(User.id == appointment_data.provider_id, User.deleted_at.is_(None))
     )
     if current_user.role != UserRole.ADMIN:
-        provider_result = provider_result.where(User.clinic_id == current_user.clinic_id)
-
-    provider = provider_result.scalar_one_or_none()
-    if not provider:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Provider not found or access denied"
-        )
+        patient_query = patient_query.where(Patient.primary_clinic_id == current_user.clinic_id)
+        provider_query = provider_query.where(User.clinic_id == current_user.clinic_id)
 
-    # Check for scheduling conflicts
-    conflict_query = select(Appointment).where(
+    # Scheduling conflicts for the provider
+    conflict_query = select(Appointment.id).where(
         and_(
             Appointment.provider_id == appointment_data.provider_id,
             Appointment.status.in_([
@@ -167,24 +209,88 @@ async def create_appointment(
             ]),
             Appointment.scheduled_start < appointment_data.scheduled_end,
             Appointment.scheduled_end > appointment_data.scheduled_start,
-            Appointment.deleted_at == None
+            Appointment.deleted_at.is_(None)
+        )
+    )
+
+    # Run all checks and the insert in one statement:
+    #   WITH checks AS (SELECT EXISTS(...), ...),
+    #        inserted AS (INSERT ... SELECT ... FROM checks WHERE <ok> RETURNING id, scheduled_*, created_at, updated_at)
+    #   SELECT checks.*, inserted.* FROM checks LEFT JOIN inserted ON true
+    db_appointment = Appointment(
+        **appointment_data.model_dump(),
+        status=AppointmentStatus.SCHEDULED,
+        copay_paid=False,
+    )
+    columns = Appointment.__table__.c
+    values = {
+        name: getattr(db_appointment, name)
+        for name in (*appointment_data.model_fields, "status", "copay_paid")
+    }
+
+    checks = select(
+        exists(patient_query).label("has_patient"),
+        exists(provider_query).label("has_provider"),
+        exists(conflict_query).label("has_conflict"),
+    ).cte("checks")
+    inserted = (
+        insert(Appointment)
+        .from_select(
+            list(values),
+            select(*(cast(value, columns[name].type).label(name) for name, value in values.items()))
+            .select_from(checks)
+            .where(checks.c.has_patient, checks.c.has_provider, ~checks.c.has_conflict),
+        )
+        .returning(
+            Appointment.id,
+            Appointment.scheduled_start,
+            Appointment.scheduled_end,
+            Appointment.created_at,
+            Appointment.updated_at,
+        )
+        .cte("inserted")
+    )
+    result = await db.execute(
+        select(
+            checks,
+            inserted.c.id,
+            inserted.c.scheduled_start,
+            inserted.c.scheduled_end,
+            inserted.c.created_at,
+            inserted.c.updated_at,
         )
+        .select_from(checks.outerjoin(inserted, true()))
     )
-    conflict_result = await db.execute(conflict_query)
-    if conflict_result.scalar_one_or_none():
+    outcome = result.one()
+
+    if not outcome.has_patient:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Patient not found or access denied"
+        )
+
+    if not outcome.has_provider:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Provider not found or access denied"
+        )
+
+    if outcome.has_conflict:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Scheduling conflict: Provider has another appointment at this time"
         )
 
-    # Create appointment
-    db_appointment = Appointment(**appointment_data.model_dump())
-    db.add(db_appointment)
     await db.commit()
-    await db.refresh(db_appointment)
+    # Respond with the stored values: the request's datetimes may be naive or in another offset
+    db_appointment.id = outcome.id
+    db_appointment.scheduled_start = outcome.scheduled_start
+    db_appointment.scheduled_end = outcome.scheduled_end
+    db_appointment.created_at = outcome.created_at
+    db_appointment.updated_at = outcome.updated_at
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -195,10 +301,10 @@ async def create_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment_data.patient_id),
-            "provider_id": str(appointment_data.provider_id),
-            "scheduled_start": appointment_data.scheduled_start.isoformat(),
-            "appointment_type": appointment_data.appointment_type.value,
+            "patient_id": appointment_data.patient_id,
+            "provider_id": appointment_data.provider_id,
+            "scheduled_start": db_appointment.scheduled_start,
+            "appointment_type": appointment_data.appointment_type,
         }
     )
 
@@ -217,13 +323,7 @@ async def get_appointment(
     """
 
     # Get appointment with access control
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
-    )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
+    query = select(Appointment).where(*_appointment_access(appointment_id, current_user))
     result = await db.execute(query)
     appointment = result.scalar_one_or_none()
 
@@ -234,7 +334,7 @@ async def get_appointment(
         )
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -245,16 +345,12 @@ async def get_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
-            "provider_id": str(appointment.provider_id),
+            "patient_id": appointment.patient_id,
+            "provider_id": appointment.provider_id,
         }
     )
 
-    appointment_dict = appointment.__dict__.copy()
-    appointment_dict['can_check_in'] = appointment.can_check_in
-    appointment_dict['is_past'] = appointment.is_past
-
-    return AppointmentResponse.model_validate(appointment_dict)
+    return AppointmentResponse.model_validate(appointment)
 
 
 @router.put("/{appointment_id}", response_model=AppointmentResponse)
@@ -270,13 +366,7 @@ async def update_appointment(
     """
 
     # Get existing appointment
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
-    )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
+    query = select(Appointment).where(*_appointment_access(appointment_id, current_user))
     result = await db.execute(query)
     appointment = result.scalar_one_or_none()
 
@@ -291,7 +381,7 @@ async def update_appointment(
         new_start = appointment_data.scheduled_start or appointment.scheduled_start
         new_end = appointment_data.scheduled_end or appointment.scheduled_end
 
-        conflict_query = select(Appointment).where(
+        conflict_query = select(Appointment.id).where(
             and_(
                 Appointment.provider_id == appointment.provider_id,
                 Appointment.id != appointment_id,
@@ -303,11 +393,10 @@ async def update_appointment(
                 ]),
                 Appointment.scheduled_start < new_end,
                 Appointment.scheduled_end > new_start,
-                Appointment.deleted_at == None
+                Appointment.deleted_at.is_(None)
             )
         )
-        conflict_result = await db.execute(conflict_query)
-        if conflict_result.scalar_one_or_none():
+        if await db.scalar(select(exists(conflict_query))):
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
                 detail="Scheduling conflict: Provider has another appointment at this time"
@@ -318,13 +407,10 @@ async def update_appointment(
     for field, value in update_data.items():
         setattr(appointment, field, value)
 
-    appointment.updated_at = datetime.utcnow()
-
     await db.commit()
-    await db.refresh(appointment)
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -335,16 +421,12 @@ async def update_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
+            "patient_id": appointment.patient_id,
             "updated_fields": list(update_data.keys()),
         }
     )
 
-    appointment_dict = appointment.__dict__.copy()
-    appointment_dict['can_check_in'] = appointment.can_check_in
-    appointment_dict['is_past'] = appointment.is_past
-
-    return AppointmentResponse.model_validate(appointment_dict)
+    return AppointmentResponse.model_validate(appointment)
 
 
 @router.delete("/{appointment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -358,33 +440,35 @@ async def cancel_appointment(
     Cancel an appointment.
     """
 
-    # Get appointment
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
+    # Cancel in place unless already finished; the self-join exposes the pre-update status
+    previous = Appointment.__table__.alias("previous")
+    result = await db.execute(
+        update(Appointment)
+        .where(
+            Appointment.id == previous.c.id,
+            *_appointment_access(appointment_id, current_user),
+            Appointment.status.notin_([AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED]),
+        )
+        .values(
+            status=AppointmentStatus.CANCELLED,
+            cancelled_at=func.now(),
+            cancelled_by_id=current_user.id,
+        )
+        .returning(Appointment.patient_id, previous.c.status.label("original_status"))
+        .execution_options(synchronize_session=False)
     )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
-    result = await db.execute(query)
-    appointment = result.scalar_one_or_none()
+    appointment = result.one_or_none()
 
     if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Appointment not found"
+        await _raise_transition_error(
+            db, appointment_id, current_user,
+            "Completed or cancelled appointments cannot be cancelled",
         )
 
-    # Cancel appointment
-    appointment.status = AppointmentStatus.CANCELLED
-    appointment.cancelled_at = datetime.utcnow()
-    appointment.cancelled_by_id = current_user.id
-    appointment.updated_at = datetime.utcnow()
-
     await db.commit()
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -395,8 +479,8 @@ async def cancel_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
-            "original_status": appointment.status.value,
+            "patient_id": appointment.patient_id,
+            "original_status": appointment.original_status,
         }
     )
 
@@ -412,40 +496,33 @@ async def check_in_appointment(
     Check in a patient for their appointment.
     """
 
-    # Get appointment
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
+    # Check in only within the check-in window, evaluated by the database
+    result = await db.execute(
+        update(Appointment)
+        .where(
+            *_appointment_access(appointment_id, current_user),
+            Appointment.can_check_in,
+        )
+        .values(
+            status=AppointmentStatus.CHECKED_IN,
+            checked_in_at=func.now(),
+            checked_in_by=f"staff:{current_user.id}",
+        )
+        .returning(Appointment.patient_id, Appointment.status, Appointment.checked_in_at)
+        .execution_options(synchronize_session=False)
     )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
-    result = await db.execute(query)
-    appointment = result.scalar_one_or_none()
+    appointment = result.one_or_none()
 
     if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Appointment not found"
-        )
-
-    # Check if appointment can be checked in
-    if not appointment.can_check_in:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Appointment cannot be checked in at this time"
+        await _raise_transition_error(
+            db, appointment_id, current_user,
+            "Appointment cannot be checked in at this time",
         )
 
-    # Update appointment status
-    appointment.status = AppointmentStatus.CHECKED_IN
-    appointment.checked_in_at = datetime.utcnow()
-    appointment.checked_in_by = f"staff:{current_user.id}"
-    appointment.updated_at = datetime.utcnow()
-
     await db.commit()
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -456,7 +533,7 @@ async def check_in_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
+            "patient_id": appointment.patient_id,
             "check_in_method": "staff",
         }
     )
@@ -480,39 +557,30 @@ async def start_appointment(
     Start an appointment (provider action).
     """
 
-    # Get appointment
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
+    # Only the assigned provider (or an admin) can start a checked-in appointment
+    result = await db.execute(
+        update(Appointment)
+        .where(
+            *_provider_criteria(appointment_id, current_user),
+            Appointment.status == AppointmentStatus.CHECKED_IN,
+        )
+        .values(status=AppointmentStatus.IN_PROGRESS, actual_start=func.now())
+        .returning(Appointment.patient_id, Appointment.status, Appointment.actual_start)
+        .execution_options(synchronize_session=False)
     )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
-    result = await db.execute(query)
-    appointment = result.scalar_one_or_none()
+    appointment = result.one_or_none()
 
     if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Appointment not found"
+        await _raise_transition_error(
+            db, appointment_id, current_user,
+            "Only checked-in appointments can be started",
+            provider_detail="Only the assigned provider can start this appointment",
         )
 
-    # Check if provider is authorized
-    if appointment.provider_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the assigned provider can start this appointment"
-        )
-
-    # Update appointment status
-    appointment.status = AppointmentStatus.IN_PROGRESS
-    appointment.actual_start = datetime.utcnow()
-    appointment.updated_at = datetime.utcnow()
-
     await db.commit()
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -523,7 +591,7 @@ async def start_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
+            "patient_id": appointment.patient_id,
         }
     )
 
@@ -546,39 +614,30 @@ async def complete_appointment(
     Complete an appointment (provider action).
     """
 
-    # Get appointment
-    query = select(Appointment).where(
-        and_(Appointment.id == appointment_id, Appointment.deleted_at == None)
+    # Only the assigned provider (or an admin) can complete an appointment in progress
+    result = await db.execute(
+        update(Appointment)
+        .where(
+            *_provider_criteria(appointment_id, current_user),
+            Appointment.status == AppointmentStatus.IN_PROGRESS,
+        )
+        .values(status=AppointmentStatus.COMPLETED, actual_end=func.now())
+        .returning(Appointment.patient_id, Appointment.status, Appointment.actual_end)
+        .execution_options(synchronize_session=False)
     )
-
-    if current_user.role not in [UserRole.ADMIN, UserRole.DOCTOR]:
-        query = query.where(Appointment.clinic_id == current_user.clinic_id)
-
-    result = await db.execute(query)
-    appointment = result.scalar_one_or_none()
+    appointment = result.one_or_none()
 
     if not appointment:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Appointment not found"
+        await _raise_transition_error(
+            db, appointment_id, current_user,
+            "Only appointments in progress can be completed",
+            provider_detail="Only the assigned provider can complete this appointment",
         )
 
-    # Check if provider is authorized
-    if appointment.provider_id != current_user.id and current_user.role != UserRole.ADMIN:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Only the assigned provider can complete this appointment"
-        )
-
-    # Update appointment status
-    appointment.status = AppointmentStatus.COMPLETED
-    appointment.actual_end = datetime.utcnow()
-    appointment.updated_at = datetime.utcnow()
-
     await db.commit()
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -589,7 +648,7 @@ async def complete_appointment(
         user_agent=request.headers.get("user-agent"),
         clinic_id=current_user.clinic_id,
         metadata={
-            "patient_id": str(appointment.patient_id),
+            "patient_id": appointment.patient_id,
         }
     )
 
@@ -599,4 +658,3 @@ async def complete_appointment(
         "status": appointment.status.value,
         "actual_end": appointment.actual_end.isoformat()
     }
-
@@ -3,31 +3,58 @@ Authentication endpoints.
 Handles login, registration, MFA, and token management.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional
+import logging
+from datetime import timedelta
+from functools import lru_cache
+from typing import Annotated, Optional
+from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from email_validator import validate_email
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from pydantic import BaseModel, EmailStr
-from sqlalchemy import select
+from pydantic import AfterValidator, BaseModel
+from sqlalchemy import select, insert, update, or_, func, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.postgres import get_db
+from api.dependencies import get_current_user as get_authenticated_user
+from database.postgres import AsyncSessionLocal, get_db
 from models.user import User, UserRole
 from security.auth import (
+    DUMMY_PASSWORD_HASH,
     password_manager,
     jwt_manager,
     mfa_manager,
 )
-from security.audit import audit_logger
+from security.audit_batcher import audit_batcher
+from security.login_limiter import is_login_blocked, record_login_failure
+from security.user_cache import revoke_token, forget_verified_token
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 security = HTTPBearer()
 
+# Logins on the same account within this window share one last_login write
+LAST_LOGIN_WRITE_INTERVAL = timedelta(seconds=5)
+
+# Hot statement built once; executed with {"email": <lowercased email>}
+USER_BY_EMAIL = select(User).where(func.lower(User.email) == bindparam("email"), User.deleted_at.is_(None))
+
+
+@lru_cache(maxsize=10_000)
+def _normalize_email(value: str) -> str:
+    """Validate an email address (syntax only, no DNS) and return its normalized form."""
+    return validate_email(value, check_deliverability=False).normalized
+
+
+# Email field for the auth hot paths; repeat logins reuse the cached normalization
+Email = Annotated[str, AfterValidator(_normalize_email)]
+
 
 # Request/Response Models
 class LoginRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
 
 
@@ -44,7 +71,7 @@ class MFAVerifyRequest(BaseModel):
 
 
 class RegisterRequest(BaseModel):
-    email: EmailStr
+    email: Email
     password: str
     first_name: str
     last_name: str
@@ -56,10 +83,38 @@ class RefreshTokenRequest(BaseModel):
     refresh_token: str
 
 
+async def _record_last_login(user_id: UUID) -> None:
+    """
+    Stamp a user's last login outside the login request's transaction.
+    No-ops if another login wrote it within LAST_LOGIN_WRITE_INTERVAL.
+    
+    Args:
+        user_id: User who logged in
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(User)
+                .where(
+                    User.id == user_id,
+                    or_(
+                        User.last_login.is_(None),
+                        User.last_login < func.now() - LAST_LOGIN_WRITE_INTERVAL,
+                    ),
+                )
+                .values(last_login=func.now())
+                .execution_options(synchronize_session=False)
+            )
+            await session.commit()
+    except Exception:
+        logger.exception("Failed to record last login for user %s", user_id)
+
+
 @router.post("/login", response_model=LoginResponse)
 async def login(
     request: Request,
     login_data: LoginRequest,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db)
 ) -> LoginResponse:
     """
@@ -70,14 +125,24 @@ async def login(
     client_ip = request.client.host if request.client else "unknown"
     user_agent = request.headers.get("user-agent")
     
+    # Refuse before hashing anything once an IP has too many failures
+    if await is_login_blocked(client_ip):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many failed login attempts, try again later"
+        )
+    
     # Find user by email
-    query = select(User).where(User.email == login_data.email, User.deleted_at == None)
-    result = await db.execute(query)
+    result = await db.execute(USER_BY_EMAIL, {"email": login_data.email.lower()})
     user = result.scalar_one_or_none()
     
     if not user:
+        # Spend the same hashing time as a wrong password so unknown emails aren't detectable
+        password_manager.verify_password(login_data.password, DUMMY_PASSWORD_HASH)
+        await record_login_failure(client_ip)
+        
         # Log failed attempt
-        await audit_logger.log_login_attempt(
+        audit_batcher.enqueue_login_attempt(
             email=login_data.email,
             user_id=None,
             success=False,
@@ -92,8 +157,10 @@ async def login(
     
     # Verify password
     if not password_manager.verify_password(login_data.password, user.hashed_password):
+        await record_login_failure(client_ip)
+        
         # Log failed attempt
-        await audit_logger.log_login_attempt(
+        audit_batcher.enqueue_login_attempt(
             email=login_data.email,
             user_id=user.id,
             success=False,
@@ -131,12 +198,21 @@ async def login(
         email=user.email
     )
     
-    # Update last login
-    user.last_login = datetime.utcnow()
-    await db.commit()
+    # Upgrade legacy bcrypt (or outdated argon2) hashes while the plaintext is at hand
+    if password_manager.needs_rehash(user.hashed_password):
+        await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(hashed_password=password_manager.hash_password(login_data.password))
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+    
+    # Stamp last login after the response, without holding the user row lock here
+    background_tasks.add_task(_record_last_login, user.id)
     
     # Log successful login
-    await audit_logger.log_login_attempt(
+    audit_batcher.enqueue_login_attempt(
         email=user.email,
         user_id=user.id,
         success=True,
@@ -168,7 +244,7 @@ async def register(
     Register a new user account.
     """
     # Check if email already exists
-    query = select(User).where(User.email == register_data.email)
+    query = select(User).where(func.lower(User.email) == register_data.email.lower())
     result = await db.execute(query)
     existing_user = result.scalar_one_or_none()
     
@@ -181,20 +257,22 @@ async def register(
     # Create new user
     hashed_password = password_manager.hash_password(register_data.password)
     
-    new_user = User(
-        email=register_data.email,
-        hashed_password=hashed_password,
-        first_name=register_data.first_name,
-        last_name=register_data.last_name,
-        phone=register_data.phone,
-        role=register_data.role,
-        is_active=True,
-        is_verified=False
+    result = await db.execute(
+        insert(User)
+        .values(
+            email=register_data.email,
+            hashed_password=hashed_password,
+            first_name=register_data.first_name,
+            last_name=register_data.last_name,
+            phone=register_data.phone,
+            role=register_data.role,
+            is_active=True,
+            is_verified=False
+        )
+        .returning(User.id, User.email)
     )
-    
-    db.add(new_user)
+    new_user = result.one()
     await db.commit()
-    await db.refresh(new_user)
     
     return {
         "message": "User registered successfully",
@@ -239,41 +317,23 @@ async def logout(
 ) -> dict:
     """
     Logout user (invalidate token).
-    Note: In production, implement token blacklisting in Redis.
+    The token's jti is revoked in Redis until the token would have expired.
     """
-    # TODO: Add token to blacklist in Redis
+    forget_verified_token(credentials.credentials)
+    payload = jwt_manager.verify_token(credentials.credentials)
+    if payload and payload.get("jti"):
+        await revoke_token(payload["jti"], payload["exp"])
     
     return {"message": "Logged out successfully"}
 
 
 @router.get("/me")
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
+    user: User = Depends(get_authenticated_user)
 ) -> dict:
     """
     Get current authenticated user information.
     """
-    # Verify token
-    payload = jwt_manager.verify_token(credentials.credentials)
-    
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid or expired token"
-        )
-    
-    # Get user from database
-    query = select(User).where(User.id == payload["sub"])
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
     return {
         "id": str(user.id),
         "email": user.email,
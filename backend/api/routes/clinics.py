@@ -2,12 +2,16 @@
 Clinic management endpoints.
 """
 
-from datetime import datetime
-from typing import List, Optional
+import hashlib
+from typing import List, Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
-from sqlalchemy import select, and_, func
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, or_, func, exists
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies import (
@@ -19,68 +23,160 @@ from api.dependencies import (
 )
 from models.clinic import Clinic, ClinicLocation
 from models.user import User, UserRole
-from schemas.clinic import ClinicCreate, ClinicUpdate, ClinicResponse, ClinicListResponse
-from security.audit import audit_logger
+from schemas.clinic import (
+    ClinicCreate,
+    ClinicUpdate,
+    ClinicResponse,
+    ClinicListResponse,
+    ClinicLocationResponse,
+)
+from security.audit_batcher import audit_batcher
 
 router = APIRouter()
 
+# SQLSTATE for unique_violation; clinics.code is the only unique column a write can collide on
+UNIQUE_VIOLATION = "23505"
+
+# Single validator for a page of clinics instead of one call per row
+CLINIC_LIST_ADAPTER = TypeAdapter(List[ClinicResponse])
+
+# Clinic data changes rarely; admins (who edit it) revalidate sooner
+ADMIN_CACHE_CONTROL = "private, max-age=30"
+DEFAULT_CACHE_CONTROL = "private, max-age=300"
+
+
+def _clinic_access(current_user: User) -> list:
+    """
+    WHERE criteria limiting clinics to those the user may view.
+    Soft-deleted clinics are excluded for everyone.
+    
+    Args:
+        current_user: Current user
+        
+    Returns:
+        List of SQLAlchemy criteria
+    """
+    criteria = [Clinic.deleted_at.is_(None)]
+    if current_user.role != UserRole.ADMIN:
+        criteria.append(Clinic.is_active == True)
+        if current_user.role == UserRole.STAFF:
+            criteria.append(Clinic.id == current_user.clinic_id)
+    return criteria
+
+
+def _etag(*parts: object) -> str:
+    """
+    Build a strong ETag from the values that determine a response body.
+    
+    Args:
+        *parts: Values identifying the response version
+        
+    Returns:
+        Quoted ETag header value
+    """
+    digest = hashlib.blake2b(":".join(map(str, parts)).encode(), digest_size=16)
+    return f'"{digest.hexdigest()}"'
+
+
+def _conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    current_user: User
+) -> Optional[Response]:
+    """
+    Apply caching headers and honor If-None-Match.
+    
+    Args:
+        request: FastAPI request object
+        response: Response whose headers are set for a full body
+        etag: Current ETag of the resource
+        current_user: Current user (sets the max-age)
+        
+    Returns:
+        Empty 304 response if the client's copy is current, otherwise None
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": ADMIN_CACHE_CONTROL if current_user.role == UserRole.ADMIN else DEFAULT_CACHE_CONTROL,
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
+
 
 @router.get("", response_model=ClinicListResponse)
 async def list_clinics(
     request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
     pagination: PaginationParams = Depends(),
     search: Optional[str] = Query(None, description="Search by name or code"),
     state: Optional[str] = Query(None, description="Filter by state"),
     is_active: Optional[bool] = Query(None, description="Filter by active status"),
-) -> ClinicListResponse:
+) -> Union[ClinicListResponse, Response]:
     """
     List clinics with filtering and pagination.
     """
 
-    # Build base query
-    query = select(Clinic)
-
-    # Non-admin users can only see active clinics in their state (if staff) or their assigned clinic
-    if current_user.role != UserRole.ADMIN:
-        query = query.where(Clinic.is_active == True)
-        if current_user.role == UserRole.STAFF:
-            # Staff can only see their assigned clinic
-            query = query.where(Clinic.id == current_user.clinic_id)
+    # Build filters shared by the count and page queries; non-admin users only
+    # see active clinics (staff only their assigned clinic)
+    filters = _clinic_access(current_user)
 
     # Apply filters
     if search:
         search_term = f"%{search}%"
-        query = query.where(
-            and_(
+        filters.append(
+            or_(
                 Clinic.name.ilike(search_term),
                 Clinic.code.ilike(search_term)
             )
         )
 
     if state:
-        query = query.where(Clinic.state == state)
+        filters.append(Clinic.state == state)
 
     if is_active is not None:
-        query = query.where(Clinic.is_active == is_active)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query)
-    result = await db.execute(count_query)
-    total = result.scalar()
-
-    # Apply pagination and ordering
-    query = query.order_by(Clinic.name).offset(pagination.offset).limit(pagination.limit)
+        filters.append(Clinic.is_active == is_active)
+
+    # Page and total in one scan (total rides along as a window function)
+    query = (
+        select(Clinic, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Clinic.name)
+        .offset(pagination.skip)
+        .limit(pagination.limit)
+    )
 
     # Execute query
     result = await db.execute(query)
-    clinics = result.scalars().all()
+    rows = result.all()
+    clinics = [row.Clinic for row in rows]
+
+    if rows:
+        total = rows[0].total
+    elif pagination.page > 1:
+        # Past the last page: no rows to carry the window count
+        result = await db.execute(select(func.count(Clinic.id)).where(*filters))
+        total = result.scalar()
+    else:
+        total = 0
+
+    # The page changes only if its rows, their versions or the total change
+    etag = _etag(total, *(f"{clinic.id}@{clinic.updated_at.isoformat()}" for clinic in clinics))
+    not_modified = _conditional_response(request, response, etag, current_user)
+    if not_modified:
+        return not_modified
 
     # Convert to response format
-    items = []
-    for clinic in clinics:
-        items.append(ClinicResponse.model_validate(clinic))
+    items = CLINIC_LIST_ADAPTER.validate_python(clinics, from_attributes=True)
 
     return ClinicListResponse(
         items=items,
@@ -99,24 +195,25 @@ async def create_clinic(
     Create a new clinic (admin only).
     """
 
-    # Check if clinic code already exists
-    existing_clinic = await db.execute(
-        select(Clinic).where(Clinic.code == clinic_data.code)
+    # Create clinic; a taken code inserts nothing and returns no row
+    result = await db.execute(
+        insert(Clinic)
+        .values(**clinic_data.model_dump())
+        .on_conflict_do_nothing(index_elements=[Clinic.code])
+        .returning(Clinic)
     )
-    if existing_clinic.scalar_one_or_none():
+    db_clinic = result.scalar_one_or_none()
+
+    if db_clinic is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Clinic code already exists"
         )
 
-    # Create clinic
-    db_clinic = Clinic(**clinic_data.model_dump())
-    db.add(db_clinic)
     await db.commit()
-    await db.refresh(db_clinic)
 
     # Log audit event
-    await audit_logger.log_admin_action(
+    audit_batcher.enqueue_action(
         user_id=current_user.id,
         user_email=current_user.email,
         action="CREATE_CLINIC",
@@ -136,22 +233,17 @@ async def create_clinic(
 @router.get("/{clinic_id}", response_model=ClinicResponse)
 async def get_clinic(
     request: Request,
+    response: Response,
     clinic_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> ClinicResponse:
+) -> Union[ClinicResponse, Response]:
     """
     Get clinic details by ID.
     """
 
     # Get clinic with access control
-    query = select(Clinic).where(Clinic.id == clinic_id)
-
-    if current_user.role != UserRole.ADMIN:
-        query = query.where(Clinic.is_active == True)
-        if current_user.role == UserRole.STAFF:
-            query = query.where(Clinic.id == current_user.clinic_id)
-
+    query = select(Clinic).where(Clinic.id == clinic_id, *_clinic_access(current_user))
     result = await db.execute(query)
     clinic = result.scalar_one_or_none()
 
@@ -162,7 +254,7 @@ async def get_clinic(
         )
 
     # Log audit event
-    await audit_logger.log_admin_action(
+    audit_batcher.enqueue_action(
         user_id=current_user.id,
         user_email=current_user.email,
         action="VIEW_CLINIC",
@@ -175,6 +267,12 @@ async def get_clinic(
         }
     )
 
+    not_modified = _conditional_response(
+        request, response, _etag(clinic.id, clinic.updated_at.isoformat()), current_user
+    )
+    if not_modified:
+        return not_modified
+
     return ClinicResponse.model_validate(clinic)
 
 
@@ -190,8 +288,23 @@ async def update_clinic(
     Update clinic information (admin only).
     """
 
-    # Get existing clinic
-    result = await db.execute(select(Clinic).where(Clinic.id == clinic_id))
+    # Update fields in one statement; the unique index on code rejects duplicates
+    update_data = clinic_data.model_dump(exclude_unset=True)
+    try:
+        result = await db.execute(
+            update(Clinic)
+            .where(Clinic.id == clinic_id, Clinic.deleted_at.is_(None))
+            .values(**update_data, updated_at=func.now())
+            .returning(Clinic)
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        if getattr(exc.orig, "sqlstate", None) == UNIQUE_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Clinic code already exists"
+            ) from exc
+        raise
     clinic = result.scalar_one_or_none()
 
     if not clinic:
@@ -200,29 +313,10 @@ async def update_clinic(
             detail="Clinic not found"
         )
 
-    # Check if code is being changed and already exists
-    if clinic_data.code and clinic_data.code != clinic.code:
-        existing_clinic = await db.execute(
-            select(Clinic).where(Clinic.code == clinic_data.code)
-        )
-        if existing_clinic.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Clinic code already exists"
-            )
-
-    # Update fields
-    update_data = clinic_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(clinic, field, value)
-
-    clinic.updated_at = datetime.utcnow()
-
     await db.commit()
-    await db.refresh(clinic)
 
     # Log audit event
-    await audit_logger.log_admin_action(
+    audit_batcher.enqueue_action(
         user_id=current_user.id,
         user_email=current_user.email,
         action="UPDATE_CLINIC",
@@ -250,9 +344,19 @@ async def delete_clinic(
     Soft delete a clinic (admin only).
     """
 
-    # Get clinic
-    result = await db.execute(select(Clinic).where(Clinic.id == clinic_id))
-    clinic = result.scalar_one_or_none()
+    # Check if clinic has active users or patients
+    # In a real implementation, you might want to prevent deletion
+    # or cascade the soft delete to related records
+
+    # Soft delete; the RETURNING row doubles as the existence check
+    result = await db.execute(
+        update(Clinic)
+        .where(Clinic.id == clinic_id, Clinic.deleted_at.is_(None))
+        .values(deleted_at=func.now())
+        .returning(Clinic.name, Clinic.code)
+        .execution_options(synchronize_session=False)
+    )
+    clinic = result.one_or_none()
 
     if not clinic:
         raise HTTPException(
@@ -260,16 +364,10 @@ async def delete_clinic(
             detail="Clinic not found"
         )
 
-    # Check if clinic has active users or patients
-    # In a real implementation, you might want to prevent deletion
-    # or cascade the soft delete to related records
-
-    # Soft delete
-    clinic.deleted_at = datetime.utcnow()
     await db.commit()
 
     # Log audit event
-    await audit_logger.log_admin_action(
+    audit_batcher.enqueue_action(
         user_id=current_user.id,
         user_email=current_user.email,
         action="DELETE_CLINIC",
@@ -284,39 +382,52 @@ async def delete_clinic(
     )
 
 
-@router.get("/{clinic_id}/locations", response_model=List[dict])
+@router.get("/{clinic_id}/locations", response_model=List[ClinicLocationResponse])
 async def list_clinic_locations(
     request: Request,
     clinic_id: UUID,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> List[dict]:
+) -> ORJSONResponse:
     """
     List locations within a clinic.
     """
 
-    # Verify clinic access
-    await get_clinic(request, clinic_id, current_user, db)
-
-    # Get locations
+    # Get locations, joined to the clinic so access is checked in the same query.
+    # Only the response columns are selected; rows map straight to the JSON objects.
+    access = _clinic_access(current_user)
     result = await db.execute(
-        select(ClinicLocation).where(
-            and_(ClinicLocation.clinic_id == clinic_id, ClinicLocation.is_active == True)
+        select(
+            ClinicLocation.id,
+            ClinicLocation.name,
+            ClinicLocation.code,
+            ClinicLocation.building,
+            ClinicLocation.floor,
+            ClinicLocation.room_number,
+            ClinicLocation.description,
+            ClinicLocation.created_at,
+        )
+        .join(Clinic, Clinic.id == ClinicLocation.clinic_id)
+        .where(
+            ClinicLocation.clinic_id == clinic_id,
+            ClinicLocation.is_active == True,
+            *access
         )
     )
-    locations = result.scalars().all()
-
-    return [
-        {
-            "id": loc.id,
-            "name": loc.name,
-            "code": loc.code,
-            "building": loc.building,
-            "floor": loc.floor,
-            "room_number": loc.room_number,
-            "description": loc.description,
-            "created_at": loc.created_at.isoformat(),
-        }
-        for loc in locations
-    ]
+    locations = result.mappings().all()
+
+    # No rows: tell "no locations" apart from "no such clinic / no access"
+    if not locations:
+        clinic_visible = await db.scalar(
+            select(exists().where(Clinic.id == clinic_id, *access))
+        )
+        if not clinic_visible:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Clinic not found"
+            )
+
+    # Rows already match ClinicLocationResponse; orjson encodes UUIDs and
+    # datetimes natively, so skip model validation and per-row conversion
+    return ORJSONResponse([dict(loc) for loc in locations])
 
@@ -2,12 +2,18 @@
 Patient management endpoints.
 """
 
-from datetime import datetime
+import asyncio
+import logging
+from datetime import datetime, timezone
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request, Query
-from sqlalchemy import select, and_, or_, func, text
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request, Response, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy import select, update, func, text, exists, bindparam, cast, Date, literal_column, null, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.dependencies import (
@@ -19,97 +25,448 @@ from api.dependencies import (
     PaginationParams,
     get_db
 )
-from database.postgres import get_db
-from models.patient import Patient, MedicalHistory, Allergy, Gender, BloodType
+from api.response_cache import (
+    PATIENT_LIST_NAMESPACE,
+    namespace_generation,
+    response_cache_key,
+    get_cached_response,
+    cache_response,
+    invalidate_namespace,
+)
+from config import settings
+from database.postgres import AsyncSessionLocal, copy_records, get_db
+from models.patient import Patient, MedicalHistory, Allergy, Gender, BloodType, PATIENT_SEARCH_TEXT
 from models.user import User, UserRole
-from schemas.patient import PatientCreate, PatientUpdate, PatientResponse, PatientListResponse
-from security.audit import audit_logger
-from security.encryption import encrypt_field, decrypt_field
+from schemas.patient import (
+    AllergyCreate,
+    MedicalHistoryCreate,
+    PatientCreate,
+    PatientHistoryImport,
+    PatientListResponse,
+    PatientResponse,
+    PatientUpdate,
+)
+from security.audit_batcher import audit_batcher
+from security.encryption import field_encryption
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Hot statements built once; executed with {"patient_id": ...} (+ {"clinic_id": ...})
+PATIENT_BY_ID = select(Patient).where(Patient.id == bindparam("patient_id"), Patient.deleted_at.is_(None))
+PATIENT_BY_ID_IN_CLINIC = PATIENT_BY_ID.where(Patient.primary_clinic_id == bindparam("clinic_id"))
 
-@router.get("", response_model=PatientListResponse)
-async def list_patients(
-    request: Request,
-    current_user: User = Depends(require_permission("patients", "read")),
-    db: AsyncSession = Depends(get_db),
-    pagination: PaginationParams = Depends(),
-    search: Optional[str] = Query(None, description="Search by name, MRN, or email"),
-    clinic_id: Optional[UUID] = Query(None, description="Filter by clinic"),
-    gender: Optional[Gender] = Query(None, description="Filter by gender"),
-    age_min: Optional[int] = Query(None, ge=0, le=150, description="Minimum age"),
-    age_max: Optional[int] = Query(None, ge=0, le=150, description="Maximum age"),
-) -> PatientListResponse:
+# SQLSTATE for unique_violation; patients.email (live rows) is the only unique column an update can collide on
+UNIQUE_VIOLATION = "23505"
+
+# Planner row estimate for the patients table, evaluated once per statement
+PATIENT_ROW_ESTIMATE = literal_column(
+    "(SELECT reltuples::bigint FROM pg_class WHERE oid = 'patients'::regclass)"
+)
+
+# Single validator for a page of patients instead of one call per row
+PATIENT_LIST_ADAPTER = TypeAdapter(List[PatientResponse])
+
+# Caps concurrent next-page prefetches so they cannot crowd out user requests for connections
+_PREFETCH_SLOTS = asyncio.Semaphore(settings.patient_list_prefetch_concurrency)
+
+
+def _patient_access(patient_id: UUID, current_user: User) -> list:
     """
-    List patients with filtering and pagination.
+    WHERE criteria for a live patient the user is allowed to see.
+    
+    Args:
+        patient_id: Patient ID
+        current_user: Current user
+        
+    Returns:
+        List of SQLAlchemy criteria
+    """
+    criteria = [Patient.id == patient_id, Patient.deleted_at == None]
+    if current_user.role != UserRole.ADMIN:
+        criteria.append(Patient.primary_clinic_id == current_user.clinic_id)
+    return criteria
 
-    Supports filtering by:
-    - Search query (name, MRN, email)
-    - Clinic assignment
-    - Gender
-    - Age range
+
+async def _get_accessible_patient(
+    db: AsyncSession,
+    patient_id: UUID,
+    current_user: User
+) -> Optional[Patient]:
+    """
+    Load a live patient the user is allowed to see.
+    
+    Args:
+        db: Database session
+        patient_id: Patient ID
+        current_user: Current user
+        
+    Returns:
+        Patient, or None if missing or outside the user's clinic
+    """
+    if current_user.role == UserRole.ADMIN:
+        result = await db.execute(PATIENT_BY_ID, {"patient_id": patient_id})
+    else:
+        result = await db.execute(
+            PATIENT_BY_ID_IN_CLINIC,
+            {"patient_id": patient_id, "clinic_id": current_user.clinic_id}
+        )
+    return result.scalar_one_or_none()
+
+
+def _patient_history_query(patient_id: UUID, current_user: User):
+    """
+    One statement returning a patient's MRN, medical history and allergies.
+    Rows share one column layout and are told apart by ``kind``
+    ("patient", "history", "allergy"); nothing is returned when the
+    patient is missing or outside the user's clinic.
+    
+    Args:
+        patient_id: Patient ID
+        current_user: Current user
+        
+    Returns:
+        SQLAlchemy UNION ALL statement
+    """
+    accessible = (
+        select(Patient.id, Patient.medical_record_number)
+        .where(*_patient_access(patient_id, current_user))
+        .cte("accessible")
+    )
+    is_accessible = exists(select(accessible.c.id))
+
+    patient_row = select(
+        literal_column("'patient'").label("kind"),
+        accessible.c.id.label("id"),
+        accessible.c.medical_record_number.label("label"),
+        null().label("code"),
+        null().label("detail"),
+        null().label("severity"),
+        null().label("start_date"),
+        null().label("end_date"),
+        null().label("is_chronic"),
+        null().label("created_at"),
+    )
+    history_rows = select(
+        literal_column("'history'"),
+        MedicalHistory.id,
+        MedicalHistory.condition,
+        MedicalHistory.icd10_code,
+        MedicalHistory.notes,
+        null(),
+        MedicalHistory.diagnosis_date,
+        MedicalHistory.resolution_date,
+        MedicalHistory.is_chronic,
+        MedicalHistory.created_at,
+    ).where(MedicalHistory.patient_id == patient_id, is_accessible)
+    allergy_rows = select(
+        literal_column("'allergy'"),
+        Allergy.id,
+        Allergy.allergen,
+        Allergy.allergen_type,
+        Allergy.reaction,
+        Allergy.severity,
+        Allergy.onset_date,
+        null(),
+        null(),
+        Allergy.created_at,
+    ).where(Allergy.patient_id == patient_id, is_accessible)
+
+    return union_all(patient_row, history_rows, allergy_rows)
+
+
+async def _copy_patient_rows(
+    db: AsyncSession,
+    model: type,
+    patient_id: UUID,
+    records: list,
+) -> int:
+    """
+    COPY a patient's child rows (history, allergies) into the model's table.
+    
+    Args:
+        db: Database session
+        model: MedicalHistory or Allergy
+        patient_id: Patient the rows belong to
+        records: Validated create schemas
+        
+    Returns:
+        Number of rows written
     """
+    if not records:
+        return 0
+    fields = list(type(records[0]).model_fields)
+    now = datetime.now(timezone.utc)
+    await copy_records(
+        db,
+        model.__tablename__,
+        ["id", "patient_id", *fields, "created_at", "updated_at"],
+        [
+            (uuid4(), patient_id, *(getattr(record, field) for field in fields), now, now)
+            for record in records
+        ],
+    )
+    return len(records)
 
-    # Build base query
-    query = select(Patient).where(Patient.deleted_at == None)
+
+async def bulk_create_medical_history(
+    db: AsyncSession,
+    patient_id: UUID,
+    records: List[MedicalHistoryCreate],
+) -> int:
+    """
+    Bulk-insert medical history entries for a patient with COPY.
+    
+    Args:
+        db: Database session
+        patient_id: Patient ID
+        records: Medical history entries
+        
+    Returns:
+        Number of rows written
+    """
+    return await _copy_patient_rows(db, MedicalHistory, patient_id, records)
+
+
+async def bulk_create_allergies(
+    db: AsyncSession,
+    patient_id: UUID,
+    records: List[AllergyCreate],
+) -> int:
+    """
+    Bulk-insert allergy entries for a patient with COPY.
+    
+    Args:
+        db: Database session
+        patient_id: Patient ID
+        records: Allergy entries
+        
+    Returns:
+        Number of rows written
+    """
+    return await _copy_patient_rows(db, Allergy, patient_id, records)
+
+
+def _patient_list_filters(
+    current_user: User,
+    search: Optional[str],
+    clinic_id: Optional[UUID],
+    gender: Optional[Gender],
+    age_min: Optional[int],
+    age_max: Optional[int]
+) -> list:
+    """
+    WHERE criteria for a patient listing.
+    
+    Args:
+        current_user: Current user (limits non-admins to their clinic)
+        search: Name, MRN or email fragment
+        clinic_id: Clinic filter
+        gender: Gender filter
+        age_min: Minimum age
+        age_max: Maximum age
+        
+    Returns:
+        List of SQLAlchemy criteria
+    """
+    filters = [Patient.deleted_at == None]
 
     # Apply clinic access control
     if current_user.role != UserRole.ADMIN:
-        query = query.where(Patient.primary_clinic_id == current_user.clinic_id)
+        filters.append(Patient.primary_clinic_id == current_user.clinic_id)
 
     # Apply filters
     if search:
-        search_term = f"%{search}%"
-        query = query.where(
-            or_(
-                Patient.first_name.ilike(search_term),
-                Patient.last_name.ilike(search_term),
-                Patient.medical_record_number.ilike(search_term),
-                Patient.email.ilike(search_term),
-            )
-        )
+        # One predicate over the trigram-indexed name/MRN/email text
+        filters.append(PATIENT_SEARCH_TEXT.like(f"%{search.lower()}%"))
 
     if clinic_id:
-        await verify_clinic_access(clinic_id, current_user)
-        query = query.where(Patient.primary_clinic_id == clinic_id)
+        filters.append(Patient.primary_clinic_id == clinic_id)
 
     if gender:
-        query = query.where(Patient.gender == gender)
+        filters.append(Patient.gender == gender)
 
-    if age_min is not None or age_max is not None:
-        # Calculate age using SQL
-        age_expr = func.extract('year', func.age(Patient.date_of_birth))
+    # Age bounds become date_of_birth ranges (relative to the database's current
+    # date) so the (clinic, date_of_birth) index can serve them
+    if age_min is not None:
+        filters.append(
+            Patient.date_of_birth <= cast(func.current_date() - func.make_interval(age_min), Date)
+        )
+    if age_max is not None:
+        filters.append(
+            Patient.date_of_birth > cast(func.current_date() - func.make_interval(age_max + 1), Date)
+        )
 
-        if age_min is not None:
-            query = query.where(age_expr >= age_min)
-        if age_max is not None:
-            query = query.where(age_expr <= age_max)
+    return filters
 
-    # Get total count
-    count_query = select(func.count()).select_from(query)
-    result = await db.execute(count_query)
-    total = result.scalar()
 
-    # Apply pagination
-    query = query.offset(pagination.offset).limit(pagination.limit)
+async def _render_patient_page(
+    db: AsyncSession,
+    filters: list,
+    pagination: PaginationParams,
+    estimate_total: bool = False
+) -> PatientListResponse:
+    """
+    Load one page of patients with its total.
+    
+    Args:
+        db: Database session
+        filters: Criteria from _patient_list_filters
+        pagination: Page to load
+        estimate_total: Take the total from planner statistics instead of counting
+            (only meaningful when filters are just the live-row criterion)
+        
+    Returns:
+        Patient list response
+    """
+    # Page and total in one statement: the total rides along either as a
+    # window count (a full scan of the matches) or as the table's row estimate
+    total_column = PATIENT_ROW_ESTIMATE if estimate_total else func.count().over()
+    query = (
+        select(Patient, total_column.label("total"))
+        .where(*filters)
+        .offset(pagination.skip)
+        .limit(pagination.limit)
+    )
 
     # Execute query
     result = await db.execute(query)
-    patients = result.scalars().all()
+    rows = result.all()
+    patients = [row.Patient for row in rows]
+
+    total_is_estimate = False
+    if rows and estimate_total and len(rows) < pagination.limit:
+        # A short page means this is the last one, so the total is known exactly
+        total = pagination.skip + len(rows)
+    elif rows and estimate_total:
+        # reltuples lags behind writes (and is -1 before the first ANALYZE)
+        total = max(rows[0].total, pagination.skip + len(rows))
+        total_is_estimate = True
+    elif rows:
+        total = rows[0].total
+    elif pagination.page > 1:
+        # Past the last page: no rows to carry the window count
+        result = await db.execute(select(func.count(Patient.id)).where(*filters))
+        total = result.scalar()
+    else:
+        total = 0
 
     # Convert to response format
-    items = []
-    for patient in patients:
-        items.append(PatientResponse.model_validate(patient))
+    items = PATIENT_LIST_ADAPTER.validate_python(patients, from_attributes=True)
 
     return PatientListResponse(
         items=items,
         total=total,
         page=pagination.page,
         per_page=pagination.per_page,
-        pages=(total + pagination.per_page - 1) // pagination.per_page
+        pages=(total + pagination.per_page - 1) // pagination.per_page,
+        total_is_estimate=total_is_estimate
+    )
+
+
+async def _prefetch_patient_page(
+    cache_key: str,
+    filters: list,
+    pagination: PaginationParams,
+    estimate_total: bool = False
+) -> None:
+    """
+    Warm the response cache with a page the user is likely to request next.
+    Skipped when prefetch slots are busy, so prefetching never queues behind itself.
+    
+    Args:
+        cache_key: Response cache key of the page
+        filters: Criteria from _patient_list_filters
+        pagination: Page to load
+        estimate_total: Passed through to _render_patient_page
+    """
+    if _PREFETCH_SLOTS.locked():
+        return
+
+    async with _PREFETCH_SLOTS:
+        try:
+            if await get_cached_response(cache_key) is not None:
+                return
+            async with AsyncSessionLocal() as session:
+                page = await _render_patient_page(session, filters, pagination, estimate_total)
+            await cache_response(
+                PATIENT_LIST_NAMESPACE, cache_key, page.model_dump_json(),
+                settings.patient_list_cache_ttl_seconds
+            )
+        except Exception:
+            logger.warning("Patient list prefetch failed", exc_info=True)
+
+
+@router.get("", response_model=PatientListResponse)
+async def list_patients(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    current_user: User = Depends(require_permission("patients", "read")),
+    db: AsyncSession = Depends(get_db),
+    pagination: PaginationParams = Depends(),
+    search: Optional[str] = Query(None, description="Search by name, MRN, or email"),
+    clinic_id: Optional[UUID] = Query(None, description="Filter by clinic"),
+    gender: Optional[Gender] = Query(None, description="Filter by gender"),
+    age_min: Optional[int] = Query(None, ge=0, le=150, description="Minimum age"),
+    age_max: Optional[int] = Query(None, ge=0, le=150, description="Maximum age"),
+) -> Response:
+    """
+    List patients with filtering and pagination.
+
+    Supports filtering by:
+    - Search query (name, MRN, email)
+    - Clinic assignment
+    - Gender
+    - Age range
+
+    Responses are cached in Redis per caller scope and query for a short TTL,
+    and the following page is prefetched into the cache after responding.
+    """
+
+    if clinic_id:
+        await verify_clinic_access(clinic_id, current_user)
+
+    # The key includes the caller's role and clinic so cached PHI never crosses scopes
+    key_parts = (
+        current_user.role.value, current_user.clinic_id,
+        search, clinic_id, gender, age_min, age_max,
+    )
+    # Read before the page is loaded, so a write committing meanwhile retires this key
+    generation = await namespace_generation(PATIENT_LIST_NAMESPACE)
+    cache_key = response_cache_key(
+        PATIENT_LIST_NAMESPACE, generation, *key_parts, pagination.page, pagination.per_page
+    )
+    cached = await get_cached_response(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    filters = _patient_list_filters(current_user, search, clinic_id, gender, age_min, age_max)
+
+    # Unfiltered admin listings span the whole table; estimate rather than count it
+    estimate_total = current_user.role == UserRole.ADMIN and not (
+        search or clinic_id or gender or age_min is not None or age_max is not None
     )
+    page = await _render_patient_page(db, filters, pagination, estimate_total)
+
+    # Serialize once for both the cache and the response
+    body = page.model_dump_json()
+    await cache_response(PATIENT_LIST_NAMESPACE, cache_key, body, settings.patient_list_cache_ttl_seconds)
+
+    # Users usually page forward next; fetch it while they read this one
+    if page.page < page.pages and cache_key is not None:
+        next_page = PaginationParams(page=pagination.page + 1, per_page=pagination.per_page)
+        background_tasks.add_task(
+            _prefetch_patient_page,
+            response_cache_key(
+                PATIENT_LIST_NAMESPACE, generation, *key_parts, next_page.page, next_page.per_page
+            ),
+            filters,
+            next_page,
+            estimate_total,
+        )
+
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("", response_model=PatientResponse, status_code=status.HTTP_201_CREATED)
@@ -126,51 +483,48 @@ async def create_patient(
     # Verify clinic access
     await verify_clinic_access(patient_data.primary_clinic_id, current_user)
 
-    # Check if MRN already exists
-    existing_patient = await db.execute(
-        select(Patient).where(Patient.medical_record_number == patient_data.medical_record_number)
-    )
-    if existing_patient.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="Medical record number already exists"
-        )
-
-    # Check if email already exists (if provided)
-    if patient_data.email:
-        existing_patient = await db.execute(
-            select(Patient).where(Patient.email == patient_data.email)
-        )
-        if existing_patient.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Patient with this email already exists"
-            )
-
     # Generate medical record number if not provided
-    if not hasattr(patient_data, 'medical_record_number') or not patient_data.medical_record_number:
+    medical_record_number = getattr(patient_data, 'medical_record_number', None)
+    if not medical_record_number:
         # Generate MRN based on clinic and timestamp
         timestamp = datetime.now().strftime("%Y%m%d")
         clinic_prefix = f"CLINIC-{patient_data.primary_clinic_id}"[:8]
         mrn_suffix = str(uuid4())[:8]
-        patient_data.medical_record_number = f"MRN-{timestamp}-{clinic_prefix}-{mrn_suffix}"
+        medical_record_number = f"MRN-{timestamp}-{clinic_prefix}-{mrn_suffix}"
 
     # Encrypt sensitive fields
-    encrypted_ssn = encrypt_field(patient_data.ssn) if patient_data.ssn else None
+    # A single Fernet token over ~9 bytes takes microseconds; cheaper inline than a thread hop
+    encrypted_ssn = field_encryption.encrypt_ssn(patient_data.ssn) if patient_data.ssn else None
 
-    # Create patient
-    db_patient = Patient(
-        **patient_data.model_dump(exclude={'ssn'}),
-        ssn=encrypted_ssn,
-        created_by_id=current_user.id,
+    # Create patient; unique indexes on MRN and live email make a duplicate insert nothing
+    result = await db.execute(
+        insert(Patient)
+        .values(
+            **patient_data.model_dump(exclude={'ssn', 'medical_record_number'}),
+            medical_record_number=medical_record_number,
+            ssn=encrypted_ssn,
+        )
+        .on_conflict_do_nothing()
+        .returning(Patient)
     )
+    db_patient = result.scalar_one_or_none()
+
+    if db_patient is None:
+        # Only the conflict path pays for finding out which value was taken
+        mrn_taken = await db.scalar(
+            select(exists().where(Patient.medical_record_number == medical_record_number))
+        )
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Medical record number already exists" if mrn_taken
+            else "Patient with this email already exists"
+        )
 
-    db.add(db_patient)
     await db.commit()
-    await db.refresh(db_patient)
+    await invalidate_namespace(PATIENT_LIST_NAMESPACE)
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -201,16 +555,7 @@ async def get_patient(
     """
 
     # Get patient with clinic access check
-    query = select(Patient).where(
-        and_(Patient.id == patient_id, Patient.deleted_at == None)
-    )
-
-    # Apply clinic access control
-    if current_user.role != UserRole.ADMIN:
-        query = query.where(Patient.primary_clinic_id == current_user.clinic_id)
-
-    result = await db.execute(query)
-    patient = result.scalar_one_or_none()
+    patient = await _get_accessible_patient(db, patient_id, current_user)
 
     if not patient:
         raise HTTPException(
@@ -219,7 +564,7 @@ async def get_patient(
         )
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -250,16 +595,28 @@ async def update_patient(
     Update patient information.
     """
 
-    # Get existing patient
-    query = select(Patient).where(
-        and_(Patient.id == patient_id, Patient.deleted_at == None)
-    )
-
-    # Apply clinic access control
-    if current_user.role != UserRole.ADMIN:
-        query = query.where(Patient.primary_clinic_id == current_user.clinic_id)
+    # Verify clinic access if clinic is being changed
+    if patient_data.primary_clinic_id:
+        await verify_clinic_access(patient_data.primary_clinic_id, current_user)
 
-    result = await db.execute(query)
+    # Update in place and read the new row back in the same statement; the
+    # live-email unique index reports a taken email
+    update_data = patient_data.model_dump(exclude_unset=True)
+    try:
+        result = await db.execute(
+            update(Patient)
+            .where(*_patient_access(patient_id, current_user))
+            .values(**update_data, updated_at=func.now())
+            .returning(Patient)
+        )
+    except IntegrityError as exc:
+        await db.rollback()
+        if getattr(exc.orig, "sqlstate", None) == UNIQUE_VIOLATION:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Patient with this email already exists"
+            ) from exc
+        raise
     patient = result.scalar_one_or_none()
 
     if not patient:
@@ -268,33 +625,11 @@ async def update_patient(
             detail="Patient not found"
         )
 
-    # Check if email is being changed and already exists
-    if patient_data.email and patient_data.email != patient.email:
-        existing_patient = await db.execute(
-            select(Patient).where(Patient.email == patient_data.email)
-        )
-        if existing_patient.scalar_one_or_none():
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="Patient with this email already exists"
-            )
-
-    # Verify clinic access if clinic is being changed
-    if patient_data.primary_clinic_id and patient_data.primary_clinic_id != patient.primary_clinic_id:
-        await verify_clinic_access(patient_data.primary_clinic_id, current_user)
-
-    # Update fields
-    update_data = patient_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(patient, field, value)
-
-    patient.updated_at = datetime.utcnow()
-
     await db.commit()
-    await db.refresh(patient)
+    await invalidate_namespace(PATIENT_LIST_NAMESPACE)
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -326,9 +661,7 @@ async def delete_patient(
     """
 
     # Get patient
-    result = await db.execute(
-        select(Patient).where(Patient.id == patient_id)
-    )
+    result = await db.execute(PATIENT_BY_ID, {"patient_id": patient_id})
     patient = result.scalar_one_or_none()
 
     if not patient:
@@ -340,9 +673,10 @@ async def delete_patient(
     # Soft delete
     patient.deleted_at = datetime.utcnow()
     await db.commit()
+    await invalidate_namespace(PATIENT_LIST_NAMESPACE)
 
     # Log audit event
-    await audit_logger.log_phi_access(
+    audit_batcher.enqueue_phi_access(
         user_id=current_user.id,
         user_email=current_user.email,
         user_role=current_user.role.value,
@@ -359,57 +693,122 @@ async def delete_patient(
     )
 
 
-@router.get("/{patient_id}/history", response_model=List[dict])
+@router.get("/{patient_id}/history", response_class=ORJSONResponse)
 async def get_patient_history(
     request: Request,
     patient_id: UUID,
     current_user: User = Depends(require_permission("patients", "read")),
     db: AsyncSession = Depends(get_db),
-) -> List[dict]:
+) -> ORJSONResponse:
     """
     Get patient's medical history.
     """
 
-    # Verify patient exists and user has access
-    await get_patient(request, patient_id, current_user, db)
+    # Access check, medical history and allergies in one round trip
+    result = await db.execute(_patient_history_query(patient_id, current_user))
+    rows = result.all()
 
-    # Get medical history
-    result = await db.execute(
-        select(MedicalHistory).where(MedicalHistory.patient_id == patient_id)
-    )
-    history = result.scalars().all()
+    patient_mrn = next((row.label for row in rows if row.kind == "patient"), None)
+    if patient_mrn is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Patient not found"
+        )
 
-    # Get allergies
-    result = await db.execute(
-        select(Allergy).where(Allergy.patient_id == patient_id)
+    history = [row for row in rows if row.kind == "history"]
+    allergies = [row for row in rows if row.kind == "allergy"]
+
+    # Log audit event
+    audit_batcher.enqueue_phi_access(
+        user_id=current_user.id,
+        user_email=current_user.email,
+        user_role=current_user.role.value,
+        action="READ",
+        resource_type="medical_history",
+        resource_id=patient_id,
+        ip_address=request.client.host if request.client else "unknown",
+        user_agent=request.headers.get("user-agent"),
+        clinic_id=current_user.clinic_id,
+        metadata={
+            "patient_mrn": patient_mrn,
+        }
     )
-    allergies = result.scalars().all()
 
-    return {
+    # orjson encodes the UUID, date and datetime values itself
+    return ORJSONResponse({
         "medical_history": [
             {
                 "id": h.id,
-                "condition": h.condition,
-                "icd10_code": h.icd10_code,
-                "diagnosis_date": h.diagnosis_date.isoformat(),
-                "resolution_date": h.resolution_date.isoformat() if h.resolution_date else None,
+                "condition": h.label,
+                "icd10_code": h.code,
+                "diagnosis_date": h.start_date,
+                "resolution_date": h.end_date,
                 "is_chronic": h.is_chronic,
-                "notes": h.notes,
-                "created_at": h.created_at.isoformat(),
+                "notes": h.detail,
+                "created_at": h.created_at,
             }
             for h in history
         ],
         "allergies": [
             {
                 "id": a.id,
-                "allergen": a.allergen,
-                "allergen_type": a.allergen_type,
-                "reaction": a.reaction,
+                "allergen": a.label,
+                "allergen_type": a.code,
+                "reaction": a.detail,
                 "severity": a.severity,
-                "onset_date": a.onset_date.isoformat() if a.onset_date else None,
-                "created_at": a.created_at.isoformat(),
+                "onset_date": a.start_date,
+                "created_at": a.created_at,
             }
             for a in allergies
         ]
-    }
+    })
+
+
+@router.post("/{patient_id}/history/import", status_code=status.HTTP_201_CREATED)
+async def import_patient_history(
+    request: Request,
+    patient_id: UUID,
+    history_data: PatientHistoryImport,
+    current_user: User = Depends(require_permission("patients", "update")),
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """
+    Bulk-import medical history and allergies for a patient (e.g. from a legacy system).
+    """
+    result = await db.execute(
+        select(Patient.medical_record_number).where(*_patient_access(patient_id, current_user))
+    )
+    patient_mrn = result.scalar_one_or_none()
+
+    if patient_mrn is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Patient not found"
+        )
+
+    history_count = await bulk_create_medical_history(db, patient_id, history_data.medical_history)
+    allergy_count = await bulk_create_allergies(db, patient_id, history_data.allergies)
+    await db.commit()
+
+    # Log audit event
+    audit_batcher.enqueue_phi_access(
+        user_id=current_user.id,
+        user_email=current_user.email,
+        user_role=current_user.role.value,
+        action="CREATE",
+        resource_type="medical_history",
+        resource_id=patient_id,
+        ip_address=request.client.host if request.client else "unknown",
+        user_agent=request.headers.get("user-agent"),
+        clinic_id=current_user.clinic_id,
+        metadata={
+            "patient_mrn": patient_mrn,
+            "medical_history_count": history_count,
+            "allergy_count": allergy_count,
+        }
+    )
 
+    return {
+        "medical_history": history_count,
+        "allergies": allergy_count,
+    }
@@ -28,6 +28,8 @@ class Settings(BaseSettings):
     # Server
     backend_host: str = "0.0.0.0"
     backend_port: int = 8000
+    # Worker processes for `python main.py`; ignored when reload (debug) is on
+    backend_workers: int = 1
     web_app_url: str = "http://localhost:3000"
     kiosk_app_url: str = "http://localhost:3001"
 
@@ -38,6 +40,12 @@ class Settings(BaseSettings):
     postgres_user: str
     postgres_password: str
     database_url: Optional[str] = None
+    postgres_pool_size: int = 20
+    postgres_max_overflow: int = 10
+    postgres_pool_timeout: int = 30
+    postgres_pool_recycle: int = 1800
+    postgres_query_cache_size: int = 2000
+    postgres_prepared_statement_cache_size: int = 256
 
     @property
     def get_database_url(self) -> str:
@@ -50,6 +58,16 @@ class Settings(BaseSettings):
     neo4j_uri: str = "bolt://localhost:7687"
     neo4j_user: str = "neo4j"
     neo4j_password: str
+    neo4j_max_pool_size: int = 100
+    neo4j_acquisition_timeout: float = 60
+    neo4j_max_connection_lifetime: int = 3600
+    neo4j_connection_timeout: float = 30
+    neo4j_keep_alive: bool = True
+    neo4j_liveness_check_timeout: Optional[float] = 30
+    neo4j_fetch_size: int = 1000
+    neo4j_query_cache_size: int = 10000
+    neo4j_query_cache_ttl_seconds: int = 10  # per-worker tier
+    neo4j_query_l2_ttl_seconds: int = 300  # shared Redis tier
 
     # Redis
     redis_host: str = "localhost"
@@ -57,6 +75,8 @@ class Settings(BaseSettings):
     redis_password: Optional[str] = None
     redis_db: int = 0
     redis_url: Optional[str] = None
+    patient_list_cache_ttl_seconds: int = 60
+    patient_list_prefetch_concurrency: int = 4
 
     @property
     def get_redis_url(self) -> str:
@@ -93,6 +113,11 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_access_token_expire_minutes: int = 15
     jwt_refresh_token_expire_days: int = 7
+    # Cached users are not invalidated on change: role, clinic and is_active updates
+    # reach live tokens within auth_user_cache_ttl_seconds + auth_token_cache_ttl_seconds
+    auth_user_cache_ttl_seconds: int = 300
+    auth_token_cache_size: int = 10000
+    auth_token_cache_ttl_seconds: int = 60
 
     # Encryption
     encryption_key: str
@@ -140,6 +165,7 @@ class Settings(BaseSettings):
 
     # Monitoring
     sentry_dsn: Optional[str] = None
+    sentry_traces_sample_rate: float = 0.05
     log_level: str = "INFO"
     enable_metrics: bool = True
     prometheus_port: int = 9090
@@ -147,6 +173,11 @@ class Settings(BaseSettings):
     # Security
     enable_rate_limiting: bool = True
     rate_limit_per_minute: int = 60
+    login_failure_limit: int = 10
+    login_failure_window_seconds: int = 900
+    password_argon2_time_cost: int = 3
+    password_argon2_memory_cost: int = 65536  # KiB
+    password_argon2_parallelism: int = 4
     cors_origins: str = "http://localhost:3000,http://localhost:3001"
     allowed_hosts: str = "localhost,127.0.0.1"
 
@@ -163,6 +194,10 @@ class Settings(BaseSettings):
     # Compliance
     hipaa_audit_enabled: bool = True
     audit_log_retention_years: int = 7
+    audit_partition_months_ahead: int = 3  # monthly audit partitions created ahead at startup
+    audit_batch_size: int = 1000
+    audit_batch_interval_ms: int = 50
+    audit_queue_max_size: int = 10000
     gdpr_enabled: bool = True
     auto_session_timeout_minutes: int = 30
 
@@ -172,6 +207,8 @@ class Settings(BaseSettings):
     enable_iot_monitoring: bool = False
     enable_genomic_data: bool = False
     enable_ar_features: bool = False
+    enable_kiosk_api: bool = False
+    enable_graph_api: bool = False
 
 
 @lru_cache()
@@ -3,20 +3,45 @@ PostgreSQL database connection and session management.
 Uses SQLAlchemy 2.0 async patterns.
 """
 
-from typing import AsyncGenerator
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, AsyncGenerator, Iterable, Sequence
 
+from sqlalchemy import DDL, event, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from config import settings
 
+logger = logging.getLogger(__name__)
+
+# Keep warm connections between requests; tests open a fresh connection each time
+if settings.app_env == "test":
+    pool_options = {"poolclass": NullPool}
+else:
+    pool_options = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.postgres_pool_size,
+        "max_overflow": settings.postgres_max_overflow,
+        "pool_timeout": settings.postgres_pool_timeout,
+        "pool_recycle": settings.postgres_pool_recycle,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.get_database_url.replace("postgresql://", "postgresql+asyncpg://"),
     echo=settings.debug,
     pool_pre_ping=True,
-    poolclass=NullPool if settings.app_env == "test" else None,
+    query_cache_size=settings.postgres_query_cache_size,
+    connect_args={
+        # Per-connection cache of asyncpg prepared statements
+        "prepared_statement_cache_size": settings.postgres_prepared_statement_cache_size,
+        # Short OLTP queries never benefit from JIT; planning it only adds latency
+        "server_settings": {"jit": "off"},
+    },
+    **pool_options,
 )
 
 # Create session factory
@@ -31,6 +56,10 @@ AsyncSessionLocal = async_sessionmaker(
 # Base class for models
 Base = declarative_base()
 
+# Clinic and patient search use gin_trgm_ops indexes; migrations 004/008 create the
+# extension, and create_all needs it too before it builds those indexes
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
@@ -50,3 +79,89 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+
+async def copy_records(
+    session: AsyncSession,
+    table_name: str,
+    columns: Sequence[str],
+    records: Iterable[Sequence[Any]],
+) -> None:
+    """
+    Bulk-load rows with COPY instead of one INSERT per row.
+    Runs on the session's connection, so the rows commit or roll back with it.
+    
+    Args:
+        session: Database session
+        table_name: Target table
+        columns: Column names, in record order
+        records: Row tuples
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        table_name,
+        records=records,
+        columns=list(columns),
+    )
+
+
+# Append-only tables split into monthly range partitions, named <table>_YYYY_MM, plus a
+# <table>_default partition for rows outside every monthly range
+PARTITIONED_TABLES = ("audit_logs", "login_attempts")
+PARTITION_KEY = "created_at"
+# Advisory lock so workers don't race to create the same partition
+PARTITION_LOCK_KEY = 4_201_210
+# How often running workers create upcoming partitions
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 24 * 60 * 60
+
+
+async def ensure_monthly_partitions(months_ahead: int = settings.audit_partition_months_ahead) -> None:
+    """
+    Create the DEFAULT partitions, this month's partitions and the next months_ahead, if missing.
+    Rows already in a DEFAULT partition for a new month are moved into it.
+    Nothing is dropped: retention (audit_log_retention_years) is not enforced here.
+    
+    Args:
+        months_ahead: Future months to create partitions for
+    """
+    now = datetime.now(timezone.utc)
+    year, month = now.year, now.month
+    async with engine.begin() as conn:
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+        for table in PARTITIONED_TABLES:
+            await conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+            ))
+        for _ in range(months_ahead + 1):
+            start = datetime(year, month, 1, tzinfo=timezone.utc)
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+            end = datetime(year, month, 1, tzinfo=timezone.utc)
+            # DDL takes no bind parameters; bounds are generated here, not user input
+            lower, upper = f"'{start.isoformat()}'", f"'{end.isoformat()}'"
+            for table in PARTITIONED_TABLES:
+                partition = f"{table}_{start:%Y_%m}"
+                if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": partition}):
+                    continue
+                # Attaching fails while the DEFAULT partition holds rows in the new range,
+                # so build the partition standalone, move those rows in, then attach it
+                await conn.execute(text(f"CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)"))
+                await conn.execute(text(
+                    f"WITH moved AS (DELETE FROM {table}_default "
+                    f"WHERE {PARTITION_KEY} >= {lower} AND {PARTITION_KEY} < {upper} RETURNING *) "
+                    f"INSERT INTO {partition} SELECT * FROM moved"
+                ))
+                await conn.execute(text(
+                    f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+                    f"FOR VALUES FROM ({lower}) TO ({upper})"
+                ))
+
+
+async def maintain_monthly_partitions() -> None:
+    """Keep upcoming partitions created while the worker runs. Started from app startup."""
+    while True:
+        await asyncio.sleep(PARTITION_MAINTENANCE_INTERVAL_SECONDS)
+        try:
+            await ensure_monthly_partitions()
+        except Exception:
+            logger.warning("Audit partition maintenance failed; retrying next interval", exc_info=True)
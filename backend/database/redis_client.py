@@ -0,0 +1,25 @@
+"""
+Redis connection management.
+Provides a shared async client for caching and audit spill-over.
+"""
+
+from redis.asyncio import Redis
+
+from config import settings
+
+# Create async Redis client (connections are pooled and opened lazily)
+redis_client: Redis = Redis.from_url(
+    settings.get_redis_url,
+    decode_responses=True,
+)
+
+
+async def get_redis() -> Redis:
+    """
+    Dependency for getting the shared Redis client.
+    Usage:
+        @app.get("/cached")
+        async def cached(redis: Redis = Depends(get_redis)):
+            ...
+    """
+    return redis_client
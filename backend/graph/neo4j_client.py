@@ -3,13 +3,93 @@ Neo4j graph database client for managing healthcare relationships.
 Tracks patient-doctor-clinic relationships, referrals, and care pathways.
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import functools
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import AsyncIterator, Iterable, Iterator, Optional, List, Dict, Any, Tuple, TypeVar, Union
 from uuid import UUID
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncSession
+from neo4j import (
+    READ_ACCESS,
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncTransaction,
+    Record,
+)
 from neo4j.exceptions import ServiceUnavailable
 
 from config import settings
+from graph.query_cache import GraphQueryCache
+
+logger = logging.getLogger(__name__)
+
+
+# Rows sent per UNWIND statement (or statements per transaction) in bulk writes
+BULK_BATCH_SIZE = 500
+
+_T = TypeVar("_T")
+
+
+def _batches(rows: Iterable[_T], batch_size: int) -> Iterator[List[_T]]:
+    """Split rows into lists of at most batch_size."""
+    iterator = iter(rows)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+# Shared by get_patient_journey and iter_patient_journey
+PATIENT_JOURNEY_QUERY = """
+MATCH (p:Patient {id: $patient_id})-[v:VISITED]->(c:Clinic)
+OPTIONAL MATCH (p)<-[:TREATS]-(d:Doctor)-[:WORKS_AT]->(c)
+RETURN v.visit_date as visit_date, c.name as clinic_name,
+       d.name as doctor_name, v.appointment_id as appointment_id
+ORDER BY v.visit_date ASC
+"""
+
+
+# Cache kinds for the analytics reads
+CARE_NETWORK = "care_network"
+REFERRALS = "referrals"
+JOURNEY = "journey"
+SIMILAR_PATIENTS = "similar_patients"
+CLINIC_FLOW = "clinic_flow"
+
+
+def _cache_part(value: Any) -> Any:
+    """Make an argument usable in a cache key (UUIDs as strings, lists as tuples)."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _cached_read(kind: str):
+    """
+    Cache a read method's result in the graph query cache, keyed by kind and its arguments.
+    The first argument (a patient or clinic id) lands in key[1] for scoped invalidation.
+    Cached results are shared between callers and must not be mutated.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        async def wrapper(self: "Neo4jClient", *args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (kind, *(_cache_part(value) for value in list(bound.arguments.values())[1:]))
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return cached
+            result = await method(self, *args, **kwargs)
+            return await self._cache.set(key, result)
+
+        return wrapper
+    return decorator
 
 
 class Neo4jClient:
@@ -19,20 +99,109 @@ class Neo4jClient:
     """
     
     def __init__(self) -> None:
-        """Initialize Neo4j driver."""
-        self.driver: Optional[AsyncDriver] = None
-        self._initialize_driver()
+        """Set up the client; the driver is created on first use."""
+        self._driver: Optional[AsyncDriver] = None
+        # Analytics reads repeat far more often than the graph changes
+        self._cache = GraphQueryCache()
     
-    def _initialize_driver(self) -> None:
+    @property
+    def driver(self) -> AsyncDriver:
+        """Async Neo4j driver, created on first access."""
+        if self._driver is None:
+            self._driver = self._create_driver()
+        return self._driver
+    
+    @staticmethod
+    def _create_driver() -> AsyncDriver:
         """Create async Neo4j driver instance."""
-        self.driver = AsyncGraphDatabase.driver(
+        return AsyncGraphDatabase.driver(
             settings.neo4j_uri,
             auth=(settings.neo4j_user, settings.neo4j_password),
-            max_connection_lifetime=3600,
-            max_connection_pool_size=50,
-            connection_acquisition_timeout=120,
+            max_connection_lifetime=settings.neo4j_max_connection_lifetime,
+            max_connection_pool_size=settings.neo4j_max_pool_size,
+            connection_acquisition_timeout=settings.neo4j_acquisition_timeout,
+            connection_timeout=settings.neo4j_connection_timeout,
+            keep_alive=settings.neo4j_keep_alive,
+            # Connections idle longer than this are pinged before reuse
+            liveness_check_timeout=settings.neo4j_liveness_check_timeout,
+            # Records pulled per batch while a result is iterated
+            fetch_size=settings.neo4j_fetch_size,
         )
     
+    def start(self) -> None:
+        """Start syncing cache invalidations with other workers. Call once from app startup."""
+        self._cache.start()
+    
+    async def _invalidate(self, *kinds: str, scope: Optional[Any] = None) -> None:
+        """
+        Drop cached reads of the given kinds (in every worker), optionally only those for one id.
+        
+        Args:
+            kinds: Cache kinds to drop
+            scope: Patient or clinic id the entries were read for (all if None)
+        """
+        await self._cache.invalidate(kinds, _cache_part(scope))
+    
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[AsyncTransaction]:
+        """
+        Group several writes into one transaction (one BEGIN/COMMIT).
+        Pass the yielded transaction as ``tx`` to the create_* methods;
+        it commits when the block exits and rolls back if it raises.
+        
+        Usage:
+            async with neo4j_client.transaction() as tx:
+                await neo4j_client.create_patient_node(..., tx=tx)
+                await neo4j_client.create_treats_relationship(..., tx=tx)
+        """
+        async with self.driver.session() as session:
+            async with await session.begin_transaction() as tx:
+                yield tx
+        # Per-method invalidation ran before commit; drop anything re-read meanwhile
+        await self._cache.invalidate()
+    
+    async def _read_single(self, query: str, /, **params: Any) -> Optional[Record]:
+        """
+        Run a read in a managed transaction and return its single record (or None).
+        Managed reads retry transient errors and are routed to followers in a cluster.
+        """
+        async def work(tx: AsyncManagedTransaction) -> Optional[Record]:
+            result = await tx.run(query, **params)
+            return await result.single()
+        
+        async with self.driver.session() as session:
+            return await session.execute_read(work)
+    
+    async def _read_data(self, query: str, /, **params: Any) -> List[Dict[str, Any]]:
+        """Run a read in a managed transaction and return its records as dicts."""
+        async def work(tx: AsyncManagedTransaction) -> List[Dict[str, Any]]:
+            result = await tx.run(query, **params)
+            return await result.data()
+        
+        async with self.driver.session() as session:
+            return await session.execute_read(work)
+    
+    async def _write_single(
+        self,
+        tx: Optional[AsyncTransaction],
+        query: str,
+        /,
+        **params: Any
+    ) -> Optional[Record]:
+        """
+        Run a write and return its single record (or None).
+        Uses the caller's transaction if given, else a managed write transaction
+        that the driver retries on transient errors.
+        """
+        async def work(tx: Union[AsyncTransaction, AsyncManagedTransaction]) -> Optional[Record]:
+            result = await tx.run(query, **params)
+            return await result.single()
+        
+        if tx is not None:
+            return await work(tx)
+        async with self.driver.session() as session:
+            return await session.execute_write(work)
+    
     async def verify_connectivity(self) -> bool:
         """
         Verify connection to Neo4j database.
@@ -44,59 +213,51 @@ class Neo4jClient:
                 record = await result.single()
                 return record["num"] == 1
         except ServiceUnavailable as e:
-            print(f"Neo4j connection failed: {e}")
+            logger.warning("Neo4j connection failed: %s", e)
             return False
     
     async def close(self) -> None:
         """Close Neo4j driver connection."""
-        if self.driver:
-            await self.driver.close()
+        await self._cache.stop()
+        if self._driver is not None:
+            await self._driver.close()
+            self._driver = None
     
     async def create_indexes(self) -> None:
         """
         Create indexes and constraints for optimal query performance.
         Should be run during initial setup.
         """
-        async with self.driver.session() as session:
+        statements = [
             # Patient constraints and indexes
-            await session.run(
-                "CREATE CONSTRAINT patient_id_unique IF NOT EXISTS "
-                "FOR (p:Patient) REQUIRE p.id IS UNIQUE"
-            )
-            await session.run(
-                "CREATE INDEX patient_mrn IF NOT EXISTS "
-                "FOR (p:Patient) ON (p.medical_record_number)"
-            )
-            
+            "CREATE CONSTRAINT patient_id_unique IF NOT EXISTS "
+            "FOR (p:Patient) REQUIRE p.id IS UNIQUE",
+            "CREATE INDEX patient_mrn IF NOT EXISTS "
+            "FOR (p:Patient) ON (p.medical_record_number)",
             # Doctor constraints and indexes
-            await session.run(
-                "CREATE CONSTRAINT doctor_id_unique IF NOT EXISTS "
-                "FOR (d:Doctor) REQUIRE d.id IS UNIQUE"
-            )
-            
+            "CREATE CONSTRAINT doctor_id_unique IF NOT EXISTS "
+            "FOR (d:Doctor) REQUIRE d.id IS UNIQUE",
             # Clinic constraints and indexes
-            await session.run(
-                "CREATE CONSTRAINT clinic_id_unique IF NOT EXISTS "
-                "FOR (c:Clinic) REQUIRE c.id IS UNIQUE"
-            )
-            
+            "CREATE CONSTRAINT clinic_id_unique IF NOT EXISTS "
+            "FOR (c:Clinic) REQUIRE c.id IS UNIQUE",
             # Appointment constraints
-            await session.run(
-                "CREATE CONSTRAINT appointment_id_unique IF NOT EXISTS "
-                "FOR (a:Appointment) REQUIRE a.id IS UNIQUE"
-            )
-            
+            "CREATE CONSTRAINT appointment_id_unique IF NOT EXISTS "
+            "FOR (a:Appointment) REQUIRE a.id IS UNIQUE",
             # Diagnosis constraints
-            await session.run(
-                "CREATE CONSTRAINT diagnosis_id_unique IF NOT EXISTS "
-                "FOR (d:Diagnosis) REQUIRE d.id IS UNIQUE"
-            )
-            
+            "CREATE CONSTRAINT diagnosis_id_unique IF NOT EXISTS "
+            "FOR (d:Diagnosis) REQUIRE d.id IS UNIQUE",
             # Medication constraints
-            await session.run(
-                "CREATE CONSTRAINT medication_id_unique IF NOT EXISTS "
-                "FOR (m:Medication) REQUIRE m.id IS UNIQUE"
-            )
+            "CREATE CONSTRAINT medication_id_unique IF NOT EXISTS "
+            "FOR (m:Medication) REQUIRE m.id IS UNIQUE",
+        ]
+        
+        # Independent and idempotent, so each runs on its own session concurrently
+        async def run(statement: str) -> None:
+            async with self.driver.session() as session:
+                result = await session.run(statement)
+                await result.consume()
+        
+        await asyncio.gather(*(run(statement) for statement in statements))
     
     # ==================== PATIENT OPERATIONS ====================
     
@@ -105,84 +266,82 @@ class Neo4jClient:
         patient_id: UUID,
         medical_record_number: str,
         name: str,
+        tx: Optional[AsyncTransaction] = None,
         **properties: Any
     ) -> Dict[str, Any]:
-        """Create a patient node in the graph."""
-        async with self.driver.session() as session:
-            query = """
-            CREATE (p:Patient {
-                id: $patient_id,
-                medical_record_number: $mrn,
-                name: $name,
-                created_at: datetime()
-            })
-            RETURN p
-            """
-            result = await session.run(
-                query,
-                patient_id=str(patient_id),
-                mrn=medical_record_number,
-                name=name,
-                **properties
-            )
-            record = await result.single()
-            return dict(record["p"]) if record else {}
+        """Create a patient node, or update it if one with this id exists."""
+        query = """
+        MERGE (p:Patient {id: $patient_id})
+        ON CREATE SET p.medical_record_number = $mrn, p.name = $name, p.created_at = datetime()
+        ON MATCH SET p.name = $name
+        SET p += $properties
+        RETURN p
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            patient_id=str(patient_id),
+            mrn=medical_record_number,
+            name=name,
+            properties=properties
+        )
+        # Node names show up in every cached read
+        await self._cache.invalidate()
+        return dict(record["p"]) if record else {}
     
     async def create_doctor_node(
         self,
         doctor_id: UUID,
         name: str,
         specialty: str,
+        tx: Optional[AsyncTransaction] = None,
         **properties: Any
     ) -> Dict[str, Any]:
-        """Create a doctor node in the graph."""
-        async with self.driver.session() as session:
-            query = """
-            CREATE (d:Doctor {
-                id: $doctor_id,
-                name: $name,
-                specialty: $specialty,
-                created_at: datetime()
-            })
-            RETURN d
-            """
-            result = await session.run(
-                query,
-                doctor_id=str(doctor_id),
-                name=name,
-                specialty=specialty,
-                **properties
-            )
-            record = await result.single()
-            return dict(record["d"]) if record else {}
+        """Create a doctor node, or update it if one with this id exists."""
+        query = """
+        MERGE (d:Doctor {id: $doctor_id})
+        ON CREATE SET d.created_at = datetime()
+        SET d.name = $name, d.specialty = $specialty, d += $properties
+        RETURN d
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            doctor_id=str(doctor_id),
+            name=name,
+            specialty=specialty,
+            properties=properties
+        )
+        # Node names show up in every cached read
+        await self._cache.invalidate()
+        return dict(record["d"]) if record else {}
     
     async def create_clinic_node(
         self,
         clinic_id: UUID,
         name: str,
         code: str,
+        tx: Optional[AsyncTransaction] = None,
         **properties: Any
     ) -> Dict[str, Any]:
-        """Create a clinic node in the graph."""
-        async with self.driver.session() as session:
-            query = """
-            CREATE (c:Clinic {
-                id: $clinic_id,
-                name: $name,
-                code: $code,
-                created_at: datetime()
-            })
-            RETURN c
-            """
-            result = await session.run(
-                query,
-                clinic_id=str(clinic_id),
-                name=name,
-                code=code,
-                **properties
-            )
-            record = await result.single()
-            return dict(record["c"]) if record else {}
+        """Create a clinic node, or update it if one with this id exists."""
+        query = """
+        MERGE (c:Clinic {id: $clinic_id})
+        ON CREATE SET c.created_at = datetime()
+        SET c.name = $name, c.code = $code, c += $properties
+        RETURN c
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            clinic_id=str(clinic_id),
+            name=name,
+            code=code,
+            properties=properties
+        )
+        # Node names show up in every cached read
+        await self._cache.invalidate()
+        return dict(record["c"]) if record else {}
     
     # ==================== RELATIONSHIP OPERATIONS ====================
     
@@ -190,130 +349,252 @@ class Neo4jClient:
         self,
         doctor_id: UUID,
         patient_id: UUID,
-        since: str = None
+        since: str = None,
+        tx: Optional[AsyncTransaction] = None
     ) -> bool:
         """Create TREATS relationship between doctor and patient."""
-        async with self.driver.session() as session:
-            query = """
-            MATCH (d:Doctor {id: $doctor_id})
-            MATCH (p:Patient {id: $patient_id})
-            MERGE (d)-[r:TREATS {since: coalesce($since, datetime())}]->(p)
-            RETURN r
-            """
-            result = await session.run(
-                query,
-                doctor_id=str(doctor_id),
-                patient_id=str(patient_id),
-                since=since
-            )
-            return await result.single() is not None
+        query = """
+        MATCH (d:Doctor {id: $doctor_id})
+        MATCH (p:Patient {id: $patient_id})
+        MERGE (d)-[r:TREATS {since: coalesce($since, datetime())}]->(p)
+        RETURN r
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            doctor_id=str(doctor_id),
+            patient_id=str(patient_id),
+            since=since
+        )
+        created = record is not None
+        await self._invalidate(CARE_NETWORK, JOURNEY, scope=patient_id)
+        await self._invalidate(SIMILAR_PATIENTS)
+        return created
     
     async def create_works_at_relationship(
         self,
         doctor_id: UUID,
         clinic_id: UUID,
-        role: str = "staff"
+        role: str = "staff",
+        tx: Optional[AsyncTransaction] = None
     ) -> bool:
         """Create WORKS_AT relationship between doctor and clinic."""
-        async with self.driver.session() as session:
-            query = """
-            MATCH (d:Doctor {id: $doctor_id})
-            MATCH (c:Clinic {id: $clinic_id})
-            MERGE (d)-[r:WORKS_AT {role: $role, since: datetime()}]->(c)
-            RETURN r
-            """
-            result = await session.run(
-                query,
-                doctor_id=str(doctor_id),
-                clinic_id=str(clinic_id),
-                role=role
-            )
-            return await result.single() is not None
+        query = """
+        MATCH (d:Doctor {id: $doctor_id})
+        MATCH (c:Clinic {id: $clinic_id})
+        MERGE (d)-[r:WORKS_AT {role: $role, since: datetime()}]->(c)
+        RETURN r
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            doctor_id=str(doctor_id),
+            clinic_id=str(clinic_id),
+            role=role
+        )
+        created = record is not None
+        await self._invalidate(CARE_NETWORK, JOURNEY, REFERRALS)
+        await self._invalidate(CLINIC_FLOW, scope=clinic_id)
+        return created
     
     async def create_visited_relationship(
         self,
         patient_id: UUID,
         clinic_id: UUID,
         appointment_id: UUID,
-        visit_date: str
+        visit_date: str,
+        tx: Optional[AsyncTransaction] = None
     ) -> bool:
         """Create VISITED relationship for patient visit to clinic."""
-        async with self.driver.session() as session:
-            query = """
-            MATCH (p:Patient {id: $patient_id})
-            MATCH (c:Clinic {id: $clinic_id})
-            CREATE (p)-[r:VISITED {
-                appointment_id: $appointment_id,
-                visit_date: datetime($visit_date)
-            }]->(c)
-            RETURN r
-            """
-            result = await session.run(
-                query,
-                patient_id=str(patient_id),
-                clinic_id=str(clinic_id),
-                appointment_id=str(appointment_id),
-                visit_date=visit_date
-            )
-            return await result.single() is not None
+        query = """
+        MATCH (p:Patient {id: $patient_id})
+        MATCH (c:Clinic {id: $clinic_id})
+        CREATE (p)-[r:VISITED {
+            appointment_id: $appointment_id,
+            visit_date: datetime($visit_date)
+        }]->(c)
+        RETURN r
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            patient_id=str(patient_id),
+            clinic_id=str(clinic_id),
+            appointment_id=str(appointment_id),
+            visit_date=visit_date
+        )
+        created = record is not None
+        await self._invalidate(CARE_NETWORK, JOURNEY, scope=patient_id)
+        await self._invalidate(SIMILAR_PATIENTS)
+        await self._invalidate(CLINIC_FLOW, scope=clinic_id)
+        return created
     
     async def create_referred_to_relationship(
         self,
         from_doctor_id: UUID,
         to_doctor_id: UUID,
         patient_id: UUID,
-        reason: str
+        reason: str,
+        tx: Optional[AsyncTransaction] = None
     ) -> bool:
         """Create REFERRED_TO relationship for doctor referrals."""
+        query = """
+        MATCH (d1:Doctor {id: $from_doctor_id})
+        MATCH (d2:Doctor {id: $to_doctor_id})
+        MATCH (p:Patient {id: $patient_id})
+        CREATE (d1)-[r:REFERRED {
+            patient_id: $patient_id,
+            reason: $reason,
+            date: datetime()
+        }]->(d2)
+        RETURN r
+        """
+        record = await self._write_single(
+            tx,
+            query,
+            from_doctor_id=str(from_doctor_id),
+            to_doctor_id=str(to_doctor_id),
+            patient_id=str(patient_id),
+            reason=reason
+        )
+        created = record is not None
+        await self._invalidate(REFERRALS)
+        return created
+    
+    # ==================== BULK OPERATIONS ====================
+    
+    async def _write_batches(
+        self,
+        query: str,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int
+    ) -> int:
+        """
+        Run an UNWIND $rows write once per batch, each in a retried write transaction.
+        Returns the number of rows sent.
+        """
+        async def write(tx, batch: List[Dict[str, Any]]) -> None:
+            result = await tx.run(query, rows=batch)
+            await result.consume()
+        
+        written = 0
         async with self.driver.session() as session:
-            query = """
-            MATCH (d1:Doctor {id: $from_doctor_id})
-            MATCH (d2:Doctor {id: $to_doctor_id})
-            MATCH (p:Patient {id: $patient_id})
-            CREATE (d1)-[r:REFERRED {
-                patient_id: $patient_id,
-                reason: $reason,
-                date: datetime()
-            }]->(d2)
-            RETURN r
-            """
-            result = await session.run(
-                query,
-                from_doctor_id=str(from_doctor_id),
-                to_doctor_id=str(to_doctor_id),
-                patient_id=str(patient_id),
-                reason=reason
-            )
-            return await result.single() is not None
+            for batch in _batches(rows, batch_size):
+                await session.execute_write(write, batch)
+                written += len(batch)
+        await self._cache.invalidate()
+        return written
+    
+    async def bulk_create_patient_nodes(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> int:
+        """
+        Create (or keep existing) patient nodes in batches.
+        Each row needs id, medical_record_number and name; other keys become properties.
+        """
+        query = """
+        UNWIND $rows AS row
+        MERGE (p:Patient {id: row.id})
+        ON CREATE SET p += row, p.created_at = datetime()
+        """
+        return await self._write_batches(
+            query,
+            ({**row, "id": str(row["id"])} for row in rows),
+            batch_size
+        )
+    
+    async def bulk_create_treats(
+        self,
+        pairs: Iterable[Dict[str, Any]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> int:
+        """
+        Create TREATS relationships in batches.
+        Each pair needs doctor_id and patient_id, and may carry since.
+        """
+        query = """
+        UNWIND $rows AS pr
+        MATCH (d:Doctor {id: pr.doctor_id}), (p:Patient {id: pr.patient_id})
+        MERGE (d)-[r:TREATS]->(p)
+        ON CREATE SET r.since = coalesce(pr.since, datetime())
+        """
+        return await self._write_batches(
+            query,
+            (
+                {
+                    "doctor_id": str(pair["doctor_id"]),
+                    "patient_id": str(pair["patient_id"]),
+                    "since": pair.get("since"),
+                }
+                for pair in pairs
+            ),
+            batch_size
+        )
+    
+    async def bulk_write(
+        self,
+        ops: Iterable[Tuple[str, Dict[str, Any]]],
+        batch_size: int = BULK_BATCH_SIZE
+    ) -> int:
+        """
+        Run heterogeneous writes in order, committing once per batch instead of once per write.
+        
+        Args:
+            ops: (cypher, params) pairs, e.g. a patient node followed by its relationships
+            batch_size: Statements per transaction
+            
+        Returns:
+            Number of statements run
+        """
+        async def write(tx: AsyncManagedTransaction, batch: List[Tuple[str, Dict[str, Any]]]) -> None:
+            for query, params in batch:
+                result = await tx.run(query, params)
+                await result.consume()
+        
+        written = 0
+        async with self.driver.session() as session:
+            for batch in _batches(ops, batch_size):
+                await session.execute_write(write, batch)
+                written += len(batch)
+        await self._cache.invalidate()
+        return written
     
     # ==================== QUERY OPERATIONS ====================
     
+    @_cached_read(CARE_NETWORK)
     async def get_patient_care_network(self, patient_id: UUID) -> List[Dict[str, Any]]:
         """
         Get complete care network for a patient.
         Returns all doctors, clinics, and relationships.
         """
-        async with self.driver.session() as session:
-            query = """
-            MATCH (p:Patient {id: $patient_id})
-            OPTIONAL MATCH (p)<-[:TREATS]-(d:Doctor)
-            OPTIONAL MATCH (d)-[:WORKS_AT]->(c:Clinic)
-            OPTIONAL MATCH (p)-[:VISITED]->(vc:Clinic)
-            RETURN p, collect(DISTINCT d) as doctors, 
-                   collect(DISTINCT c) as clinics,
-                   collect(DISTINCT vc) as visited_clinics
-            """
-            result = await session.run(query, patient_id=str(patient_id))
-            record = await result.single()
-            if record:
-                return {
-                    "patient": dict(record["p"]),
-                    "doctors": [dict(d) for d in record["doctors"] if d],
-                    "clinics": [dict(c) for c in record["clinics"] if c],
-                    "visited_clinics": [dict(vc) for vc in record["visited_clinics"] if vc],
-                }
-            return {}
+        # Each branch is collected in its own subquery (one row each), so doctors,
+        # their clinics and visits are never expanded against one another
+        query = """
+        MATCH (p:Patient {id: $patient_id})
+        CALL {
+            WITH p
+            MATCH (p)<-[:TREATS]-(d:Doctor)
+            RETURN collect(DISTINCT d) as doctors
+        }
+        CALL {
+            WITH p
+            MATCH (p)<-[:TREATS]-(:Doctor)-[:WORKS_AT]->(c:Clinic)
+            RETURN collect(DISTINCT c) as clinics
+        }
+        CALL {
+            WITH p
+            MATCH (p)-[:VISITED]->(vc:Clinic)
+            RETURN collect(DISTINCT vc) as visited_clinics
+        }
+        RETURN p as patient, doctors, clinics, visited_clinics
+        """
+        # data() turns the nodes (and node lists) into property dicts in one call
+        record = await self._read_single(query, patient_id=str(patient_id))
+        return record.data() if record else {}
     
+    @_cached_read(REFERRALS)
     async def get_referral_patterns(
         self,
         clinic_id: Optional[UUID] = None,
@@ -323,36 +604,31 @@ class Neo4jClient:
         Analyze referral patterns between doctors.
         Useful for understanding care coordination.
         """
-        async with self.driver.session() as session:
-            if clinic_id:
-                query = """
-                MATCH (d1:Doctor)-[:WORKS_AT]->(c:Clinic {id: $clinic_id})
-                MATCH (d1)-[r:REFERRED]->(d2:Doctor)
-                RETURN d1.name as from_doctor, d2.name as to_doctor, 
-                       count(r) as referral_count, collect(r.reason) as reasons
-                ORDER BY referral_count DESC
-                LIMIT $limit
-                """
-                result = await session.run(
-                    query,
-                    clinic_id=str(clinic_id),
-                    limit=limit
-                )
-            else:
-                query = """
-                MATCH (d1:Doctor)-[r:REFERRED]->(d2:Doctor)
-                RETURN d1.name as from_doctor, d2.name as to_doctor,
-                       count(r) as referral_count, collect(r.reason) as reasons
-                ORDER BY referral_count DESC
-                LIMIT $limit
-                """
-                result = await session.run(query, limit=limit)
-            
-            records = []
-            async for record in result:
-                records.append(dict(record))
-            return records
+        if clinic_id:
+            query = """
+            MATCH (d1:Doctor)-[:WORKS_AT]->(c:Clinic {id: $clinic_id})
+            MATCH (d1)-[r:REFERRED]->(d2:Doctor)
+            RETURN d1.name as from_doctor, d2.name as to_doctor, 
+                   count(r) as referral_count, collect(r.reason) as reasons
+            ORDER BY referral_count DESC
+            LIMIT $limit
+            """
+            return await self._read_data(
+                query,
+                clinic_id=str(clinic_id),
+                limit=limit
+            )
+        
+        query = """
+        MATCH (d1:Doctor)-[r:REFERRED]->(d2:Doctor)
+        RETURN d1.name as from_doctor, d2.name as to_doctor,
+               count(r) as referral_count, collect(r.reason) as reasons
+        ORDER BY referral_count DESC
+        LIMIT $limit
+        """
+        return await self._read_data(query, limit=limit)
     
+    @_cached_read(JOURNEY)
     async def get_patient_journey(
         self,
         patient_id: UUID
@@ -361,21 +637,23 @@ class Neo4jClient:
         Get chronological patient journey across clinics and doctors.
         Useful for care pathway analysis.
         """
-        async with self.driver.session() as session:
-            query = """
-            MATCH (p:Patient {id: $patient_id})-[v:VISITED]->(c:Clinic)
-            OPTIONAL MATCH (p)<-[:TREATS]-(d:Doctor)-[:WORKS_AT]->(c)
-            RETURN v.visit_date as visit_date, c.name as clinic_name,
-                   d.name as doctor_name, v.appointment_id as appointment_id
-            ORDER BY v.visit_date ASC
-            """
-            result = await session.run(query, patient_id=str(patient_id))
-            
-            records = []
+        return await self._read_data(PATIENT_JOURNEY_QUERY, patient_id=str(patient_id))
+    
+    async def iter_patient_journey(
+        self,
+        patient_id: UUID
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a patient journey one visit at a time, without caching.
+        Records arrive in fetch_size batches, so long journeys are never held in full.
+        Runs outside a managed transaction: a partly consumed stream cannot be retried.
+        """
+        async with self.driver.session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(PATIENT_JOURNEY_QUERY, patient_id=str(patient_id))
             async for record in result:
-                records.append(dict(record))
-            return records
+                yield record.data()
     
+    @_cached_read(SIMILAR_PATIENTS)
     async def find_similar_patients(
         self,
         patient_id: UUID,
@@ -386,25 +664,20 @@ class Neo4jClient:
         Find patients with similar care patterns.
         Useful for population health analytics and treatment recommendations.
         """
-        async with self.driver.session() as session:
-            query = """
-            MATCH (p1:Patient {id: $patient_id})<-[:TREATS]-(d:Doctor)-[:TREATS]->(p2:Patient)
-            WHERE p1 <> p2
-            WITH p2, count(DISTINCT d) as shared_doctors
-            MATCH (p2)-[:VISITED]->(c:Clinic)
-            WITH p2, shared_doctors, collect(DISTINCT c.name) as visited_clinics
-            RETURN p2.id as patient_id, p2.name as name,
-                   shared_doctors, visited_clinics
-            ORDER BY shared_doctors DESC
-            LIMIT $limit
-            """
-            result = await session.run(query, patient_id=str(patient_id), limit=limit)
-            
-            records = []
-            async for record in result:
-                records.append(dict(record))
-            return records
+        query = """
+        MATCH (p1:Patient {id: $patient_id})<-[:TREATS]-(d:Doctor)-[:TREATS]->(p2:Patient)
+        WHERE p1 <> p2
+        WITH p2, count(DISTINCT d) as shared_doctors
+        MATCH (p2)-[:VISITED]->(c:Clinic)
+        WITH p2, shared_doctors, collect(DISTINCT c.name) as visited_clinics
+        RETURN p2.id as patient_id, p2.name as name,
+               shared_doctors, visited_clinics
+        ORDER BY shared_doctors DESC
+        LIMIT $limit
+        """
+        return await self._read_data(query, patient_id=str(patient_id), limit=limit)
     
+    @_cached_read(CLINIC_FLOW)
     async def get_clinic_patient_flow(
         self,
         clinic_id: UUID,
@@ -415,21 +688,19 @@ class Neo4jClient:
         Analyze patient flow patterns for a clinic.
         Useful for resource planning and optimization.
         """
-        async with self.driver.session() as session:
-            query = """
-            MATCH (p:Patient)-[v:VISITED]->(c:Clinic {id: $clinic_id})
-            WHERE datetime($start_date) <= v.visit_date <= datetime($end_date)
-            WITH c, count(DISTINCT p) as unique_patients, count(v) as total_visits
-            MATCH (c)<-[:WORKS_AT]-(d:Doctor)
-            RETURN c.name as clinic_name, unique_patients, total_visits,
-                   count(DISTINCT d) as doctor_count
-            """
-            result = await session.run(
-                query,
-                clinic_id=str(clinic_id),
-                start_date=start_date,
-                end_date=end_date
-            )
-            record = await result.single()
-            return dict(record) if record else {}
+        query = """
+        MATCH (p:Patient)-[v:VISITED]->(c:Clinic {id: $clinic_id})
+        WHERE datetime($start_date) <= v.visit_date <= datetime($end_date)
+        WITH c, count(DISTINCT p) as unique_patients, count(v) as total_visits
+        MATCH (c)<-[:WORKS_AT]-(d:Doctor)
+        RETURN c.name as clinic_name, unique_patients, total_visits,
+               count(DISTINCT d) as doctor_count
+        """
+        record = await self._read_single(
+            query,
+            clinic_id=str(clinic_id),
+            start_date=start_date,
+            end_date=end_date
+        )
+        return record.data() if record else {}
 
@@ -0,0 +1,193 @@
+"""
+Two-tier cache for Neo4j analytics reads.
+A per-worker TTLCache (L1) sits in front of a Redis cache shared by all workers (L2);
+invalidations are broadcast over Redis pub/sub so every worker evicts its L1.
+"""
+
+import asyncio
+import hashlib
+import logging
+import uuid
+from typing import Any, Iterable, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
+from redis.exceptions import RedisError
+
+from config import settings
+from database.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+GRAPH_CACHE_PREFIX = "graph:cache:"
+INVALIDATION_CHANNEL = "graph:cache:invalidate"
+
+# Key tuples look like (kind, scope, *other_args); scope is a patient or clinic id
+CacheKey = Tuple[Any, ...]
+
+
+def _encode_graph_value(value: Any) -> Any:
+    """orjson fallback for driver types (neo4j temporal values)."""
+    if hasattr(value, "iso_format"):
+        return value.iso_format()
+    raise TypeError(f"Cannot cache {type(value).__name__}")
+
+
+def _redis_key(key: CacheKey) -> str:
+    """Redis key for a cached read."""
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=8).hexdigest()
+    return f"{GRAPH_CACHE_PREFIX}{key[0]}:{digest}"
+
+
+def _index_key(*parts: Any) -> str:
+    """Redis set tracking cached keys: all of them, one kind, or one kind for one id."""
+    return GRAPH_CACHE_PREFIX + "keys:" + ":".join(str(part) for part in parts)
+
+
+class GraphQueryCache:
+    """L1 + L2 cache of JSON-safe read results, keyed by kind and call arguments."""
+
+    def __init__(self) -> None:
+        """Create the worker-local tier; the Redis tier is shared."""
+        self._local: TTLCache = TTLCache(
+            maxsize=settings.neo4j_query_cache_size,
+            ttl=settings.neo4j_query_cache_ttl_seconds,
+        )
+        # Lets a worker ignore its own invalidation broadcasts
+        self._origin = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start listening for other workers' invalidations. Call once from app startup."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """Stop the invalidation listener."""
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def get(self, key: CacheKey) -> Optional[Any]:
+        """
+        Get a cached read result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached result, None on miss or Redis failure
+        """
+        try:
+            return self._local[key]
+        except KeyError:
+            pass
+        try:
+            payload = await redis_client.get(_redis_key(key))
+        except RedisError:
+            logger.warning("Graph cache lookup failed", exc_info=True)
+            return None
+        if payload is None:
+            return None
+        value = self._local[key] = orjson.loads(payload)
+        return value
+
+    async def set(self, key: CacheKey, value: Any) -> Any:
+        """
+        Cache a read result in both tiers.
+
+        Args:
+            key: Cache key
+            value: Result as returned by the driver
+
+        Returns:
+            The JSON-safe form that was cached (temporal values as ISO strings),
+            so fresh and cached reads look the same to callers
+        """
+        payload = orjson.dumps(value, default=_encode_graph_value)
+        value = self._local[key] = orjson.loads(payload)
+
+        redis_key = _redis_key(key)
+        ttl = settings.neo4j_query_l2_ttl_seconds
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.setex(redis_key, ttl, payload)
+                for index_key in (_index_key(), _index_key(key[0]), _index_key(key[0], key[1])):
+                    pipe.sadd(index_key, redis_key)
+                    pipe.expire(index_key, ttl)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Graph cache write failed", exc_info=True)
+        return value
+
+    async def invalidate(self, kinds: Optional[Iterable[str]] = None, scope: Optional[str] = None) -> None:
+        """
+        Drop cached reads in every worker.
+
+        Args:
+            kinds: Cache kinds to drop (all if None)
+            scope: Patient or clinic id the entries were read for (all if None)
+        """
+        kinds = list(kinds) if kinds is not None else None
+        self._evict_local(kinds, scope)
+
+        if kinds is None:
+            index_keys = [_index_key()]
+        elif scope is None:
+            index_keys = [_index_key(kind) for kind in kinds]
+        else:
+            index_keys = [_index_key(kind, scope) for kind in kinds]
+        try:
+            # Take and reset the indexes atomically so keys cached meanwhile stay tracked
+            async with redis_client.pipeline(transaction=True) as pipe:
+                for index_key in index_keys:
+                    pipe.smembers(index_key)
+                    pipe.delete(index_key)
+                results = await pipe.execute()
+            keys = set().union(*results[::2])
+            if keys:
+                await redis_client.delete(*keys)
+            await redis_client.publish(
+                INVALIDATION_CHANNEL,
+                orjson.dumps({"origin": self._origin, "kinds": kinds, "scope": scope}),
+            )
+        except RedisError:
+            logger.warning("Graph cache invalidation failed", exc_info=True)
+
+    def _evict_local(self, kinds: Optional[list], scope: Optional[str]) -> None:
+        """Drop matching entries from this worker's tier."""
+        if kinds is None:
+            self._local.clear()
+            return
+        stale = [
+            key for key in list(self._local.keys())
+            if key[0] in kinds and (scope is None or key[1] == scope)
+        ]
+        for key in stale:
+            self._local.pop(key, None)
+
+    async def _listen(self) -> None:
+        """Apply invalidations broadcast by other workers; skips malformed ones, reconnects on Redis errors."""
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    try:
+                        event = orjson.loads(message["data"])
+                        if event["origin"] != self._origin:
+                            self._evict_local(event["kinds"], event["scope"])
+                    except (orjson.JSONDecodeError, KeyError, TypeError):
+                        # Can't tell what a malformed invalidation covered; drop everything
+                        logger.warning("Malformed graph cache invalidation: %r", message["data"], exc_info=True)
+                        self._local.clear()
+            except RedisError:
+                logger.warning("Graph cache invalidation listener lost Redis; retrying", exc_info=True)
+                # Broadcasts may have been missed while disconnected
+                self._local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
@@ -3,25 +3,51 @@ DocBox Backend - Enterprise Healthcare RAG System
 Main application entry point with FastAPI.
 """
 
+import asyncio
+import logging
+import logging.handlers
+import queue
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from uuid import UUID
 
 import sentry_sdk
+from sentry_sdk.integrations.asyncio import AsyncioIntegration
+from sentry_sdk.integrations.fastapi import FastApiIntegration
+from sentry_sdk.integrations.starlette import StarletteIntegration
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from prometheus_client import make_asgi_app
+from pythonjsonlogger.json import JsonFormatter
+from sqlalchemy import func, select, text
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 
 from config import settings
-from api.routes import auth, patients, appointments, clinics, kiosk, rag, graph, admin
-from database.postgres import engine, Base
+from api.routes import auth, patients, appointments, clinics, rag, admin
+from database.postgres import engine, Base, ensure_monthly_partitions, maintain_monthly_partitions
+from database.redis_client import redis_client
 from graph.neo4j_client import Neo4jClient
+from models.audit import AuditLog
 from rag.embeddings import EmbeddingService
 from security.audit import AuditLogger
+from security.audit_batcher import audit_batcher
+
+
+# Probe and scrape endpoints dominate request volume and are never traced
+UNTRACED_PATHS = frozenset({"/health", "/ready", "/live", "/metrics"})
+
+
+def _sentry_traces_sampler(sampling_context: dict) -> float:
+    """Sample rate for a Sentry transaction: zero for probes, the configured rate otherwise."""
+    path = sampling_context.get("asgi_scope", {}).get("path", "")
+    if path in UNTRACED_PATHS or path.startswith("/metrics/"):
+        return 0.0
+    return settings.sentry_traces_sample_rate
 
 
 # Initialize Sentry for error tracking
@@ -29,13 +55,86 @@ if settings.sentry_dsn:
     sentry_sdk.init(
         dsn=settings.sentry_dsn,
         environment=settings.app_env,
-        traces_sample_rate=1.0 if settings.app_env == "development" else 0.1,
+        integrations=[
+            StarletteIntegration(transaction_style="endpoint"),
+            FastApiIntegration(transaction_style="endpoint"),
+            AsyncioIntegration(),
+        ],
+        traces_sampler=_sentry_traces_sampler,
     )
 
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address)
 
 
+logger = logging.getLogger(__name__)
+
+
+def configure_logging() -> logging.handlers.QueueListener:
+    """
+    Route application logs through a queue to a JSON stdout handler.
+    Handlers write on the listener's thread, so a slow log pipe never blocks the event loop.
+    
+    Returns:
+        Started listener; stop it at shutdown to flush queued records
+    """
+    handler = logging.StreamHandler()
+    handler.setFormatter(JsonFormatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    root.setLevel(settings.log_level.upper())
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# Cache warming: the care networks of the most-accessed patients over the last day
+CACHE_WARM_PATIENTS = 500
+CACHE_WARM_CONCURRENCY = 10
+
+
+async def warm_graph_cache(neo4j_client: Neo4jClient) -> None:
+    """
+    Pre-load hot care-network reads so a freshly started worker doesn't take
+    the cold-cache misses on live traffic. Runs in the background after startup.
+    
+    Args:
+        neo4j_client: Started Neo4j client whose cache is warmed
+    """
+    hottest = (
+        select(AuditLog.resource_id)
+        .where(
+            AuditLog.resource_type == "patient",
+            AuditLog.resource_id.is_not(None),
+            AuditLog.timestamp > func.now() - text("interval '1 day'"),
+        )
+        .group_by(AuditLog.resource_id)
+        .order_by(func.count().desc())
+        .limit(CACHE_WARM_PATIENTS)
+    )
+    try:
+        async with engine.connect() as conn:
+            patient_ids = (await conn.execute(hottest)).scalars().all()
+    except Exception:
+        logger.warning("Graph cache warm-up skipped", exc_info=True)
+        return
+    
+    semaphore = asyncio.Semaphore(CACHE_WARM_CONCURRENCY)
+    
+    async def warm(patient_id: UUID) -> None:
+        async with semaphore:
+            await neo4j_client.get_patient_care_network(patient_id)
+    
+    started = time.monotonic()
+    results = await asyncio.gather(*(warm(pid) for pid in patient_ids), return_exceptions=True)
+    failed = sum(isinstance(result, Exception) for result in results)
+    logger.info(
+        "Warmed graph cache for %d patients in %.1fs (%d failed)",
+        len(patient_ids) - failed, time.monotonic() - started, failed,
+    )
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
@@ -43,15 +142,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events.
     """
     # Startup
-    print(f"Starting {settings.app_name} - {settings.app_env} environment")
+    log_listener = configure_logging()
+    logger.info("Starting %s - %s environment", settings.app_name, settings.app_env)
     
     # Create database tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    await ensure_monthly_partitions()
+    partition_task = asyncio.create_task(maintain_monthly_partitions())
     
-    # Initialize Neo4j connection
+    # Initialize Neo4j connection (opens the driver and a pooled connection before traffic)
     neo4j_client = Neo4jClient()
     await neo4j_client.verify_connectivity()
+    neo4j_client.start()
     app.state.neo4j_client = neo4j_client
     
     # Initialize embedding service
@@ -62,16 +165,28 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     audit_logger = AuditLogger()
     app.state.audit_logger = audit_logger
     
-    print("✓ Database connections established")
-    print("✓ Services initialized")
+    # Start batched audit writer
+    audit_batcher.start()
+    
+    logger.info("Database connections established")
+    logger.info("Services initialized")
+    
+    # Warm hot graph reads without delaying startup
+    warm_task = asyncio.create_task(warm_graph_cache(neo4j_client))
     
     yield
     
     # Shutdown
-    print("Shutting down services...")
+    logger.info("Shutting down services")
+    for task in (warm_task, partition_task):
+        task.cancel()
+    await asyncio.gather(warm_task, partition_task, return_exceptions=True)
+    await audit_batcher.stop()
     await neo4j_client.close()
+    await redis_client.aclose()
     await engine.dispose()
-    print("✓ Shutdown complete")
+    logger.info("Shutdown complete")
+    log_listener.stop()
 
 
 # Initialize FastAPI application
@@ -83,15 +198,24 @@ app = FastAPI(
     redoc_url=f"/api/{settings.api_version}/redoc",
     openapi_url=f"/api/{settings.api_version}/openapi.json",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add rate limiting
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+class OriginSetCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that checks exact origins against a set instead of scanning a list."""
+    
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
+
 # CORS Middleware
 app.add_middleware(
-    CORSMiddleware,
+    OriginSetCORSMiddleware,
     allow_origins=settings.get_cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
@@ -121,32 +245,63 @@ async def health_check() -> dict:
     }
 
 
+# Seconds each readiness probe waits for a dependency
+READINESS_TIMEOUT_SECONDS = 2.0
+
+# A successful readiness check is reused for this many seconds before re-probing
+READINESS_CACHE_SECONDS = 5.0
+
+
+async def _check_database() -> None:
+    """Raise if PostgreSQL is unreachable."""
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _check_graph_db(neo4j_client: Neo4jClient) -> None:
+    """Raise if Neo4j is unreachable (driver handshake only, no session or query)."""
+    await neo4j_client.driver.verify_connectivity()
+
+
 # Readiness probe
 @app.get("/ready", tags=["System"])
 async def readiness_check(request: Request) -> dict:
     """
     Readiness probe for Kubernetes.
-    Checks if all dependencies are available.
+    Checks all dependencies concurrently and reports each one.
+    A success is reused for READINESS_CACHE_SECONDS so frequent probes stay cheap.
     """
-    try:
-        # Check database connectivity
-        async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
-        
-        # Check Neo4j connectivity
-        neo4j_client = request.app.state.neo4j_client
-        await neo4j_client.verify_connectivity()
-        
-        return {
-            "status": "ready",
-            "database": "connected",
-            "graph_db": "connected",
-        }
-    except Exception as e:
-        return JSONResponse(
+    ready_at = getattr(request.app.state, "ready_at", None)
+    if ready_at is not None and time.monotonic() - ready_at < READINESS_CACHE_SECONDS:
+        return {"status": "ready", "database": "connected", "graph_db": "connected"}
+    
+    checks = {
+        "database": _check_database(),
+        "graph_db": _check_graph_db(request.app.state.neo4j_client),
+    }
+    results = await asyncio.gather(
+        *(asyncio.wait_for(check, READINESS_TIMEOUT_SECONDS) for check in checks.values()),
+        return_exceptions=True,
+    )
+    errors = {
+        name: str(result) or type(result).__name__
+        for name, result in zip(checks, results, strict=True)
+        if isinstance(result, BaseException)
+    }
+    dependencies = {
+        name: "unavailable" if name in errors else "connected"
+        for name in checks
+    }
+    
+    if errors:
+        request.app.state.ready_at = None
+        return ORJSONResponse(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={"status": "not_ready", "error": str(e)},
+            content={"status": "not_ready", **dependencies, "errors": errors},
         )
+    
+    request.app.state.ready_at = time.monotonic()
+    return {"status": "ready", **dependencies}
 
 
 # Liveness probe
@@ -180,27 +335,35 @@ app.include_router(
     prefix=f"/api/{settings.api_version}/clinics",
     tags=["Clinics"],
 )
-app.include_router(
-    kiosk.router,
-    prefix=f"/api/{settings.api_version}/kiosk",
-    tags=["Kiosk"],
-)
 app.include_router(
     rag.router,
     prefix=f"/api/{settings.api_version}/rag",
     tags=["RAG Queries"],
 )
-app.include_router(
-    graph.router,
-    prefix=f"/api/{settings.api_version}/graph",
-    tags=["Graph Analytics"],
-)
 app.include_router(
     admin.router,
     prefix=f"/api/{settings.api_version}/admin",
     tags=["Administration"],
 )
 
+# Kiosk and graph routers have no endpoints yet; only load them when enabled
+if settings.enable_kiosk_api:
+    from api.routes import kiosk
+
+    app.include_router(
+        kiosk.router,
+        prefix=f"/api/{settings.api_version}/kiosk",
+        tags=["Kiosk"],
+    )
+if settings.enable_graph_api:
+    from api.routes import graph as graph_routes
+
+    app.include_router(
+        graph_routes.router,
+        prefix=f"/api/{settings.api_version}/graph",
+        tags=["Graph Analytics"],
+    )
+
 
 # Prometheus metrics endpoint
 if settings.enable_metrics:
@@ -210,14 +373,16 @@ if settings.enable_metrics:
 
 # Global exception handler
 @app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def global_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Global exception handler for unhandled errors.
     Logs errors and returns appropriate response.
     """
+    logger.exception("Unhandled error on %s %s", request.method, request.url.path, exc_info=exc)
+    
     if settings.app_env != "production":
         # In development, return detailed error
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
@@ -227,7 +392,7 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         )
     
     # In production, return generic error
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={"error": "Internal server error"},
     )
@@ -241,6 +406,9 @@ if __name__ == "__main__":
         host=settings.backend_host,
         port=settings.backend_port,
         reload=settings.debug,
+        workers=settings.backend_workers,
         log_level=settings.log_level.lower(),
+        loop="uvloop",
+        http="httptools",
     )
 
@@ -0,0 +1,64 @@
+"""
+Add appointment soft delete and partial indexes.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+LIVE_APPOINTMENTS = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Add appointments.deleted_at and partial indexes on live appointments."""
+
+    op.add_column('appointments', sa.Column('deleted_at', postgresql.TIMESTAMP(timezone=True), nullable=True))
+
+    # Build without blocking writes to a populated table; CONCURRENTLY can't run in a transaction
+    with op.get_context().autocommit_block():
+        # Provider overlap checks (scheduling conflicts)
+        op.create_index(
+            'idx_appointment_provider_range', 'appointments',
+            ['provider_id', 'scheduled_start', 'scheduled_end'],
+            unique=False, postgresql_where=LIVE_APPOINTMENTS, postgresql_concurrently=True
+        )
+        # Clinic schedule listings
+        op.create_index(
+            'idx_appointment_clinic_start', 'appointments',
+            ['clinic_id', 'scheduled_start'],
+            unique=False, postgresql_where=LIVE_APPOINTMENTS, postgresql_concurrently=True
+        )
+        # Patient appointment history
+        op.create_index(
+            'idx_appointment_patient', 'appointments',
+            ['patient_id'],
+            unique=False, postgresql_where=LIVE_APPOINTMENTS, postgresql_concurrently=True
+        )
+        # Status-filtered listings
+        op.create_index(
+            'idx_appointment_status_start', 'appointments',
+            ['status', 'scheduled_start'],
+            unique=False, postgresql_where=LIVE_APPOINTMENTS, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop appointment partial indexes and deleted_at."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_appointment_status_start', table_name='appointments', postgresql_concurrently=True)
+        op.drop_index('idx_appointment_patient', table_name='appointments', postgresql_concurrently=True)
+        op.drop_index('idx_appointment_clinic_start', table_name='appointments', postgresql_concurrently=True)
+        op.drop_index('idx_appointment_provider_range', table_name='appointments', postgresql_concurrently=True)
+    op.drop_column('appointments', 'deleted_at')
@@ -0,0 +1,31 @@
+"""
+Set database defaults for appointment timestamps.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Default appointments.created_at/updated_at to now()."""
+
+    op.alter_column('appointments', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('appointments', 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Drop appointment timestamp defaults."""
+
+    op.alter_column('appointments', 'updated_at', server_default=None)
+    op.alter_column('appointments', 'created_at', server_default=None)
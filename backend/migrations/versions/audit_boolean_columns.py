@@ -0,0 +1,55 @@
+"""
+Store audit flag columns as boolean instead of jsonb.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# Flag columns the models declared as JSONB. Databases built by the migrations
+# don't have most of them, so only columns that exist as jsonb are converted.
+FLAG_COLUMNS = {
+    'audit_logs': ('is_phi_access', 'is_suspicious', 'success'),
+    'login_attempts': ('success', 'mfa_used', 'mfa_success'),
+}
+
+CONVERT_COLUMN = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{column}' AND data_type = '{from_type}'
+    ) THEN
+        ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT;
+        ALTER TABLE {table} ALTER COLUMN {column} TYPE {to_type} USING {using};
+    END IF;
+END $$
+"""
+
+
+def upgrade() -> None:
+    """Convert jsonb true/false flags to boolean (rewrites the table; run in a maintenance window)."""
+
+    for table, columns in FLAG_COLUMNS.items():
+        for column in columns:
+            op.execute(CONVERT_COLUMN.format(
+                table=table, column=column, from_type='jsonb', to_type='boolean',
+                using=f"({column} #>> '{{}}')::boolean",
+            ))
+
+
+def downgrade() -> None:
+    """
+    Leave the flags as boolean.
+    login_attempts.success was boolean in the migrated schema even before this revision,
+    so which columns were jsonb isn't recoverable.
+    """
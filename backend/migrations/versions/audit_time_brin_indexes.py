@@ -0,0 +1,45 @@
+"""
+Use BRIN indexes for audit and login attempt timestamps.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+# Append-only tables whose created_at follows physical row order
+TABLES = ('audit_logs', 'login_attempts')
+
+
+def upgrade() -> None:
+    """Replace the created_at B-trees with BRIN indexes."""
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY ix_{table}_created_at_brin ON {table} "
+                "USING brin (created_at) WITH (pages_per_range = 32)"
+            )
+            op.drop_index(f'ix_{table}_created_at', table_name=table, postgresql_concurrently=True)
+            op.execute(f"ALTER INDEX ix_{table}_created_at_brin RENAME TO ix_{table}_created_at")
+
+
+def downgrade() -> None:
+    """Restore the created_at B-tree indexes."""
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"ALTER INDEX ix_{table}_created_at RENAME TO ix_{table}_created_at_brin")
+            op.create_index(
+                f'ix_{table}_created_at', table, ['created_at'],
+                unique=False, postgresql_concurrently=True
+            )
+            op.drop_index(f'ix_{table}_created_at_brin', table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""
+Compress stored-whole JSONB blobs with lz4.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+# JSONB columns written and read back whole, never filtered on by key.
+# audit_logs.changes only exists in databases built by create_all.
+BLOB_COLUMNS = (
+    ('appointments', 'intake_form_data'),
+    ('appointments', 'vitals'),
+    ('audit_logs', 'metadata'),
+    ('audit_logs', 'changes'),
+)
+
+SET_COMPRESSION = """
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{column}'
+    ) THEN
+        ALTER TABLE {table} ALTER COLUMN "{column}" SET COMPRESSION {method};
+    END IF;
+END $$
+"""
+
+
+def upgrade() -> None:
+    """Use lz4 instead of pglz for TOASTed values (applies to values written from now on)."""
+
+    for table, column in BLOB_COLUMNS:
+        op.execute(SET_COMPRESSION.format(table=table, column=column, method='lz4'))
+
+
+def downgrade() -> None:
+    """Return the blobs to the server's default compression."""
+
+    for table, column in BLOB_COLUMNS:
+        op.execute(SET_COMPRESSION.format(table=table, column=column, method='default'))
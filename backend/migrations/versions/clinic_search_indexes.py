@@ -0,0 +1,37 @@
+"""
+Add trigram indexes for clinic search.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index clinic name/code for ILIKE '%term%' search."""
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'idx_clinic_name_trgm', 'clinics', ['name'],
+        unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'idx_clinic_code_trgm', 'clinics', ['code'],
+        unique=False, postgresql_using='gin', postgresql_ops={'code': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Drop clinic search indexes."""
+
+    op.drop_index('idx_clinic_code_trgm', table_name='clinics')
+    op.drop_index('idx_clinic_name_trgm', table_name='clinics')
@@ -0,0 +1,39 @@
+"""
+Generate appointment and audit row ids in the database.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+TABLES = ('appointments', 'audit_logs', 'login_attempts')
+
+
+def upgrade() -> None:
+    """Default ids to gen_random_uuid() and audit timestamps to now()."""
+
+    # gen_random_uuid() is built in from PostgreSQL 13; pgcrypto provides it before that
+    op.execute('CREATE EXTENSION IF NOT EXISTS pgcrypto')
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+    op.alter_column('audit_logs', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('login_attempts', 'created_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    """Drop generated id and audit timestamp defaults."""
+
+    op.alter_column('login_attempts', 'created_at', server_default=None)
+    op.alter_column('audit_logs', 'created_at', server_default=None)
+    for table in reversed(TABLES):
+        op.alter_column(table, 'id', server_default=None)
@@ -0,0 +1,41 @@
+"""
+Add partial indexes over live clinics and users.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+
+def upgrade() -> None:
+    """Index live clinics by name and live users by lowercased email."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_clinic_live', 'clinics', ['name'],
+            unique=False, postgresql_where=LIVE_ROWS, postgresql_concurrently=True
+        )
+        op.create_index(
+            'idx_user_email_live', 'users', [sa.text('lower(email)')],
+            unique=True, postgresql_where=LIVE_ROWS, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop live-row indexes."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_user_email_live', table_name='users', postgresql_concurrently=True)
+        op.drop_index('idx_clinic_live', table_name='clinics', postgresql_concurrently=True)
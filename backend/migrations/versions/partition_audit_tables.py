@@ -0,0 +1,86 @@
+"""
+Partition audit_logs and login_attempts by month.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+# Secondary B-tree indexes per table; created_at additionally gets a BRIN index
+INDEXED_COLUMNS = {
+    'audit_logs': ('clinic_id', 'resource_id', 'resource_type', 'user_id'),
+    'login_attempts': ('email', 'user_id'),
+}
+
+# One partition per month from the oldest row through three months ahead. Later months
+# are created by the application (database.postgres.maintain_monthly_partitions); the
+# DEFAULT partition catches anything outside the monthly ranges so no row is rejected.
+CREATE_MONTHLY_PARTITIONS = """
+DO $$
+DECLARE
+    month timestamptz := date_trunc('month', coalesce((SELECT min(created_at) FROM {source}), now()));
+BEGIN
+    WHILE month < date_trunc('month', now()) + interval '4 months' LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF {table} FOR VALUES FROM (%L) TO (%L)',
+            '{table}_' || to_char(month, 'YYYY_MM'), month, month + interval '1 month'
+        );
+        month := month + interval '1 month';
+    END LOOP;
+    CREATE TABLE {table}_default PARTITION OF {table} DEFAULT;
+END $$
+"""
+
+
+def _create_indexes(table: str, primary_key: list) -> None:
+    """Create a table's primary key and secondary indexes."""
+
+    op.create_primary_key(f'{table}_pkey', table, primary_key)
+    op.execute(
+        f"CREATE INDEX ix_{table}_created_at ON {table} "
+        "USING brin (created_at) WITH (pages_per_range = 32)"
+    )
+    for column in INDEXED_COLUMNS[table]:
+        op.create_index(f'ix_{table}_{column}', table, [column], unique=False)
+
+
+def upgrade() -> None:
+    """Rebuild both tables as monthly range partitions on created_at, copying existing rows."""
+
+    # Partition bounds are UTC month boundaries, matching ensure_monthly_partitions
+    op.execute("SET LOCAL TIME ZONE 'UTC'")
+    for table in INDEXED_COLUMNS:
+        source = f'{table}_unpartitioned'
+        op.rename_table(table, source)
+        op.execute(
+            f"CREATE TABLE {table} (LIKE {source} INCLUDING DEFAULTS) "
+            "PARTITION BY RANGE (created_at)"
+        )
+        op.execute(CREATE_MONTHLY_PARTITIONS.format(table=table, source=source))
+        op.execute(f"INSERT INTO {table} SELECT * FROM {source}")
+        op.drop_table(source)
+        # Built after the copy, which is faster than maintaining them row by row.
+        # A partitioned table's primary key must include the partition key.
+        _create_indexes(table, ['id', 'created_at'])
+
+
+def downgrade() -> None:
+    """Copy rows back into unpartitioned tables."""
+
+    for table in INDEXED_COLUMNS:
+        source = f'{table}_partitioned'
+        op.rename_table(table, source)
+        op.execute(f"CREATE TABLE {table} (LIKE {source} INCLUDING DEFAULTS)")
+        op.execute(f"INSERT INTO {table} SELECT * FROM {source}")
+        # Drops the monthly partitions with it
+        op.drop_table(source)
+        _create_indexes(table, ['id'])
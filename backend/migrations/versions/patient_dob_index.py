@@ -0,0 +1,35 @@
+"""
+Index live patients by clinic and date of birth.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a partial index for age-filtered patient listings."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_patient_clinic_dob', 'patients', ['primary_clinic_id', 'date_of_birth'],
+            unique=False, postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the clinic/date of birth index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_patient_clinic_dob', table_name='patients', postgresql_concurrently=True)
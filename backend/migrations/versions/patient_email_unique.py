@@ -0,0 +1,35 @@
+"""
+Enforce unique email addresses for live patients.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add a partial unique index on patients.email over live rows."""
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_patient_email_live', 'patients', ['email'],
+            unique=True, postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the live patient email index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_patient_email_live', table_name='patients', postgresql_concurrently=True)
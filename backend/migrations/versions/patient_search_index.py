@@ -0,0 +1,36 @@
+"""
+Add a trigram index for patient search.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-14 12:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index the lowercased name/MRN/email text of live patients for LIKE '%term%'."""
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY idx_patient_search_trgm ON patients USING gin "
+            "((lower(first_name || ' ' || last_name || ' ' || medical_record_number || ' ' "
+            "|| coalesce(email, ''))) gin_trgm_ops) "
+            "WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    """Drop the patient search index."""
+
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_patient_search_trgm', table_name='patients', postgresql_concurrently=True)
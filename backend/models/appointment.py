@@ -3,11 +3,11 @@ Appointment scheduling models.
 """
 
 import enum
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Text, Integer, Enum, ForeignKey, Boolean
+from sqlalchemy import String, DateTime, Text, Integer, Enum, ForeignKey, Boolean, Index, ColumnElement, and_, text, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -37,18 +37,31 @@ class AppointmentType(str, enum.Enum):
     TELEHEALTH = "telehealth"
 
 
+# Check-in window: 30 minutes before to 5 minutes after the scheduled start
+CHECK_IN_EARLY = timedelta(minutes=30)
+CHECK_IN_LATE = timedelta(minutes=5)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat a naive datetime (e.g. one not yet round-tripped through the database) as UTC."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
 class Appointment(Base):
     """Patient appointment scheduling."""
     
     __tablename__ = "appointments"
     
+    # Column order packs fixed-width columns ahead of variable-width ones, widest
+    # alignment first, so PostgreSQL adds no padding between them. This only shapes
+    # tables built by create_all; the shipped migration 001 keeps its original order.
+    
+    # Identifiers and references
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        server_default=text("gen_random_uuid()")
     )
-    
-    # Patient and Provider
     patient_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("patients.id"),
@@ -61,8 +74,6 @@ class Appointment(Base):
         index=True,
         nullable=False
     )
-    
-    # Location
     clinic_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("clinics.id"),
@@ -73,6 +84,14 @@ class Appointment(Base):
         UUID(as_uuid=True),
         ForeignKey("clinic_locations.id")
     )
+    parent_appointment_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("appointments.id")
+    )
+    cancelled_by_id: Mapped[Optional[UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("users.id")
+    )
     
     # Scheduling
     scheduled_start: Mapped[datetime] = mapped_column(
@@ -84,9 +103,37 @@ class Appointment(Base):
         DateTime(timezone=True),
         nullable=False
     )
-    duration_minutes: Mapped[int] = mapped_column(Integer, default=30)
     
-    # Appointment Details
+    # Check-in and actual times
+    checked_in_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    actual_start: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    actual_end: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Reminders
+    reminder_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    confirmation_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Billing and cancellation
+    copay_paid_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    cancelled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Timestamps (set by the database; eager_defaults reads them back via RETURNING)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False
+    )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    
+    # Duration, billing and appointment details
+    duration_minutes: Mapped[int] = mapped_column(Integer, default=30)
+    copay_amount: Mapped[Optional[int]] = mapped_column(Integer)  # in cents
     appointment_type: Mapped[AppointmentType] = mapped_column(
         Enum(AppointmentType),
         default=AppointmentType.ROUTINE
@@ -97,6 +144,11 @@ class Appointment(Base):
         index=True
     )
     
+    # Flags: telehealth, follow-up, copay
+    is_telehealth: Mapped[bool] = mapped_column(Boolean, default=False)
+    is_follow_up: Mapped[bool] = mapped_column(Boolean, default=False)
+    copay_paid: Mapped[bool] = mapped_column(Boolean, default=False)
+    
     # Reason
     reason: Mapped[str] = mapped_column(Text, nullable=False)
     chief_complaint: Mapped[Optional[str]] = mapped_column(Text)
@@ -105,33 +157,10 @@ class Appointment(Base):
     provider_notes: Mapped[Optional[str]] = mapped_column(Text)
     staff_notes: Mapped[Optional[str]] = mapped_column(Text)
     
-    # Check-in Information
-    checked_in_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    # Check-in, telehealth and cancellation details
     checked_in_by: Mapped[Optional[str]] = mapped_column(String(50))  # kiosk, staff, etc.
-    
-    # Actual Times
-    actual_start: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    actual_end: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    
-    # Reminders
-    reminder_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    confirmation_sent_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    
-    # Telehealth
-    is_telehealth: Mapped[bool] = mapped_column(Boolean, default=False)
     telehealth_url: Mapped[Optional[str]] = mapped_column(String(500))
-    
-    # Follow-up
-    is_follow_up: Mapped[bool] = mapped_column(Boolean, default=False)
-    parent_appointment_id: Mapped[Optional[UUID]] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("appointments.id")
-    )
-    
-    # Billing
-    copay_amount: Mapped[Optional[int]] = mapped_column(Integer)  # in cents
-    copay_paid: Mapped[bool] = mapped_column(Boolean, default=False)
-    copay_paid_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    cancellation_reason: Mapped[Optional[str]] = mapped_column(Text)
     
     # Additional Data
     intake_form_data: Mapped[Optional[dict]] = mapped_column(JSONB)
@@ -144,41 +173,57 @@ class Appointment(Base):
     #     "weight_kg": 70
     # }
     
-    # Cancellation
-    cancelled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
-    cancelled_by_id: Mapped[Optional[UUID]] = mapped_column(
-        UUID(as_uuid=True),
-        ForeignKey("users.id")
-    )
-    cancellation_reason: Mapped[Optional[str]] = mapped_column(Text)
-    
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        nullable=False
-    )
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True),
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
-        nullable=False
+    __mapper_args__ = {"eager_defaults": True}
+    
+    __table_args__ = (
+        # Partial indexes over live appointments for conflict checks and listings
+        Index(
+            'idx_appointment_provider_range', 'provider_id', 'scheduled_start', 'scheduled_end',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_appointment_clinic_start', 'clinic_id', 'scheduled_start',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_appointment_patient', 'patient_id',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+        Index(
+            'idx_appointment_status_start', 'status', 'scheduled_start',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
     )
     
     def __repr__(self) -> str:
         return f"<Appointment(id={self.id}, patient_id={self.patient_id}, status={self.status})>"
     
-    @property
+    # Properties below also work as SQL expressions (Appointment.is_past in a WHERE
+    # compares against now() in the database and can use the scheduled_start indexes)
+    
+    @hybrid_property
     def is_past(self) -> bool:
         """Check if appointment is in the past."""
-        return self.scheduled_start < datetime.utcnow()
+        return _as_utc(self.scheduled_start) < datetime.now(timezone.utc)
+    
+    @is_past.inplace.expression
+    @classmethod
+    def _is_past_expression(cls) -> ColumnElement[bool]:
+        return cls.scheduled_start < func.now()
     
-    @property
+    @hybrid_property
     def can_check_in(self) -> bool:
         """Check if appointment can be checked in (within 30 minutes of start)."""
         if self.status != AppointmentStatus.SCHEDULED:
             return False
-        now = datetime.utcnow()
-        minutes_until = (self.scheduled_start - now).total_seconds() / 60
-        return -5 <= minutes_until <= 30  # 30 minutes before to 5 minutes after
+        now = datetime.now(timezone.utc)
+        return now - CHECK_IN_LATE <= _as_utc(self.scheduled_start) <= now + CHECK_IN_EARLY
+    
+    @can_check_in.inplace.expression
+    @classmethod
+    def _can_check_in_expression(cls) -> ColumnElement[bool]:
+        return and_(
+            cls.status == AppointmentStatus.SCHEDULED,
+            cls.scheduled_start.between(func.now() - CHECK_IN_LATE, func.now() + CHECK_IN_EARLY),
+        )
 
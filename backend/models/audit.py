@@ -5,9 +5,8 @@ All PHI access must be logged and retained for 7 years.
 
 from datetime import datetime
 from typing import Optional
-from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Text, Index
+from sqlalchemy import String, DateTime, Text, Boolean, Index, text, func, false, true
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -25,7 +24,7 @@ class AuditLog(Base):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        server_default=text("gen_random_uuid()")
     )
     
     # Who (User identification)
@@ -50,10 +49,11 @@ class AuditLog(Base):
     
     # When (Timestamp)
     timestamp: Mapped[datetime] = mapped_column(
+        "created_at",  # column name used by the migrations
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        nullable=False,
-        index=True
+        primary_key=True,  # partition key, so part of the primary key
+        server_default=func.now(),
+        nullable=False
     )
     
     # Where (Network information)
@@ -82,25 +82,35 @@ class AuditLog(Base):
     # Additional context like API endpoint, request method, etc.
     
     # Security
-    is_phi_access: Mapped[bool] = mapped_column(JSONB, default=False, index=True)
-    is_suspicious: Mapped[bool] = mapped_column(JSONB, default=False, index=True)
+    is_phi_access: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), index=True)
+    is_suspicious: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false(), index=True)
     
     # Blockchain hash (for immutable audit trail if enabled)
     blockchain_hash: Mapped[Optional[str]] = mapped_column(String(255))
     blockchain_transaction_id: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Status
-    success: Mapped[bool] = mapped_column(JSONB, default=True)
+    success: Mapped[bool] = mapped_column(Boolean, default=True, server_default=true())
     error_message: Mapped[Optional[str]] = mapped_column(Text)
     
     __table_args__ = (
+        # Rows arrive in time order, so a BRIN index covers time ranges at a fraction of a B-tree's size
+        Index(
+            'ix_audit_logs_created_at', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
         # Composite indexes for common queries
-        Index('idx_audit_user_timestamp', 'user_id', 'timestamp'),
-        Index('idx_audit_resource_timestamp', 'resource_type', 'resource_id', 'timestamp'),
-        Index('idx_audit_action_timestamp', 'action', 'timestamp'),
-        Index('idx_audit_phi_timestamp', 'is_phi_access', 'timestamp'),
+        Index('idx_audit_user_timestamp', 'user_id', 'created_at'),
+        Index('idx_audit_resource_timestamp', 'resource_type', 'resource_id', 'created_at'),
+        Index('idx_audit_action_timestamp', 'action', 'created_at'),
+        Index('idx_audit_phi_timestamp', 'is_phi_access', 'created_at'),
+        # Monthly partitions (see database.postgres.ensure_monthly_partitions)
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
     
+    # Fetch server-generated id/created_at in the INSERT's RETURNING, not a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
+    
     def __repr__(self) -> str:
         return (
             f"<AuditLog(id={self.id}, user_id={self.user_id}, "
@@ -116,7 +126,7 @@ class LoginAttempt(Base):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4
+        server_default=text("gen_random_uuid()")
     )
     
     # User
@@ -127,7 +137,7 @@ class LoginAttempt(Base):
     )
     
     # Attempt details
-    success: Mapped[bool] = mapped_column(JSONB, nullable=False, index=True)
+    success: Mapped[bool] = mapped_column(Boolean, nullable=False, index=True)
     failure_reason: Mapped[Optional[str]] = mapped_column(String(255))
     
     # Network
@@ -136,18 +146,27 @@ class LoginAttempt(Base):
     
     # Timestamp
     attempted_at: Mapped[datetime] = mapped_column(
+        "created_at",  # column name used by the migrations
         DateTime(timezone=True),
-        default=datetime.utcnow,
-        nullable=False,
-        index=True
+        primary_key=True,  # partition key, so part of the primary key
+        server_default=func.now(),
+        nullable=False
     )
     
     # MFA
-    mfa_used: Mapped[bool] = mapped_column(JSONB, default=False)
-    mfa_success: Mapped[Optional[bool]] = mapped_column(JSONB)
+    mfa_used: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    mfa_success: Mapped[Optional[bool]] = mapped_column(Boolean)
     
     __table_args__ = (
-        Index('idx_login_email_timestamp', 'email', 'attempted_at'),
-        Index('idx_login_ip_timestamp', 'ip_address', 'attempted_at'),
+        Index(
+            'ix_login_attempts_created_at', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
+        Index('idx_login_email_timestamp', 'email', 'created_at'),
+        Index('idx_login_ip_timestamp', 'ip_address', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'},
     )
+    
+    # Fetch server-generated id/created_at in the INSERT's RETURNING, not a follow-up SELECT
+    __mapper_args__ = {"eager_defaults": True}
 
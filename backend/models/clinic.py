@@ -6,7 +6,7 @@ from datetime import datetime, time
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, DateTime, Text, Time, Boolean, Integer
+from sqlalchemy import String, DateTime, Text, Time, Boolean, Integer, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -102,6 +102,20 @@ class Clinic(Base):
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
+    __table_args__ = (
+        # Name-ordered listings over live clinics
+        Index('idx_clinic_live', 'name', postgresql_where=text('deleted_at IS NULL')),
+        # Trigram indexes so ILIKE '%term%' search can avoid a seq scan
+        Index(
+            'idx_clinic_name_trgm', 'name',
+            postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'},
+        ),
+        Index(
+            'idx_clinic_code_trgm', 'code',
+            postgresql_using='gin', postgresql_ops={'code': 'gin_trgm_ops'},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Clinic(id={self.id}, name={self.name}, code={self.code})>"
     
@@ -7,7 +7,7 @@ from datetime import datetime, date
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, Date, DateTime, Text, Integer, Enum, ForeignKey, Boolean
+from sqlalchemy import String, Date, DateTime, Text, Integer, Enum, ForeignKey, Boolean, Index, text, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -138,6 +138,19 @@ class Patient(Base):
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
+    __table_args__ = (
+        # One live patient per email address
+        Index(
+            'idx_patient_email_live', 'email',
+            unique=True, postgresql_where=text('deleted_at IS NULL'),
+        ),
+        # Age-filtered listings, expressed as date of birth ranges
+        Index(
+            'idx_patient_clinic_dob', 'primary_clinic_id', 'date_of_birth',
+            postgresql_where=text('deleted_at IS NULL'),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Patient(id={self.id}, mrn={self.medical_record_number})>"
     
@@ -157,6 +170,24 @@ class Patient(Base):
         )
 
 
+# Lowercased name/MRN/email text searched by list_patients. Separators are literals
+# (not bound parameters) so queries match the index expression exactly.
+_SEARCH_SEPARATOR = literal_column("' '")
+PATIENT_SEARCH_TEXT = func.lower(
+    Patient.first_name + _SEARCH_SEPARATOR
+    + Patient.last_name + _SEARCH_SEPARATOR
+    + Patient.medical_record_number + _SEARCH_SEPARATOR
+    + func.coalesce(Patient.email, literal_column("''"))
+)
+
+# Trigram index so substring search over live patients can avoid a seq scan
+Index(
+    'idx_patient_search_trgm', PATIENT_SEARCH_TEXT.label('search_text'),
+    postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'},
+    postgresql_where=Patient.deleted_at.is_(None),
+)
+
+
 class MedicalHistory(Base):
     """Patient medical history records."""
     
@@ -7,7 +7,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import String, Boolean, DateTime, Enum, Text
+from sqlalchemy import String, Boolean, DateTime, Enum, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -80,6 +80,14 @@ class User(Base):
     # Soft delete
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
     
+    __table_args__ = (
+        # Case-insensitive login lookups over live accounts
+        Index(
+            'idx_user_email_live', text('lower(email)'),
+            unique=True, postgresql_where=text('deleted_at IS NULL'),
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<User(id={self.id}, email={self.email}, role={self.role})>"
     
@@ -3,6 +3,7 @@ Embedding generation service for RAG system.
 Supports multiple embedding models for medical knowledge vectorization.
 """
 
+import logging
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -13,6 +14,8 @@ from qdrant_client.models import Distance, VectorParams, PointStruct
 
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 
 class EmbeddingModel(str, Enum):
     """Available embedding models."""
@@ -121,8 +124,8 @@ class EmbeddingService:
                 )
             )
             return True
-        except Exception as e:
-            print(f"Error creating collection: {e}")
+        except Exception:
+            logger.exception("Error creating collection")
             return False
     
     async def upsert_documents(
@@ -168,8 +171,8 @@ class EmbeddingService:
             )
             
             return True
-        except Exception as e:
-            print(f"Error upserting documents: {e}")
+        except Exception:
+            logger.exception("Error upserting documents")
             return False
     
     async def search(
@@ -261,8 +264,8 @@ class EmbeddingService:
         try:
             self.qdrant_client.delete_collection(collection_name=collection_name)
             return True
-        except Exception as e:
-            print(f"Error deleting collection: {e}")
+        except Exception:
+            logger.exception("Error deleting collection")
             return False
 
 
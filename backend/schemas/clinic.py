@@ -135,3 +135,17 @@ class ClinicListResponse(BaseModel):
     
     model_config = ConfigDict(from_attributes=True)
 
+
+class ClinicLocationResponse(BaseModel):
+    """Schema for clinic location response."""
+    
+    id: UUID
+    name: str
+    code: str
+    building: Optional[str] = None
+    floor: Optional[str] = None
+    room_number: Optional[str] = None
+    description: Optional[str] = None
+    created_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
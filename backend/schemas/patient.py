@@ -155,6 +155,35 @@ class PatientListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    total_is_estimate: bool = False
     
     model_config = ConfigDict(from_attributes=True)
 
+
+
+class MedicalHistoryCreate(BaseModel):
+    """Schema for a medical history entry."""
+    
+    condition: str = Field(..., min_length=1, max_length=500)
+    icd10_code: Optional[str] = Field(None, max_length=20)
+    diagnosis_date: date
+    resolution_date: Optional[date] = None
+    is_chronic: bool = False
+    notes: Optional[str] = None
+
+
+class AllergyCreate(BaseModel):
+    """Schema for an allergy entry."""
+    
+    allergen: str = Field(..., min_length=1, max_length=200)
+    allergen_type: str = Field(..., max_length=50)
+    reaction: str = Field(..., min_length=1)
+    severity: str = Field(..., max_length=20)
+    onset_date: Optional[date] = None
+
+
+class PatientHistoryImport(BaseModel):
+    """Schema for bulk-importing a patient's history (e.g. from a legacy system)."""
+    
+    medical_history: list[MedicalHistoryCreate] = []
+    allergies: list[AllergyCreate] = []
@@ -0,0 +1,454 @@
+"""
+Batched, non-blocking audit log writer.
+Request handlers enqueue audit events and login attempts; a single background
+task flushes them to PostgreSQL with one binary COPY per table per batch.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Callable, Optional, Dict, Any, List, Tuple, Type, Union
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy import Column, String, exc as sa_exc
+from sqlalchemy.dialects.postgresql import JSONB
+
+from config import settings
+from database.postgres import AsyncSessionLocal, Base, copy_records
+from database.redis_client import redis_client
+from models.audit import AuditLog, LoginAttempt
+
+logger = logging.getLogger(__name__)
+
+# Redis list holding events that could not be queued or written
+SPILL_KEY = "audit:spill"
+# Redis list holding events the database rejected on their own, kept for inspection
+DEAD_LETTER_KEY = "audit:dead"
+
+# Backoff before writing or replaying again after a batch-wide failure (e.g. an outage)
+RETRY_BASE_SECONDS = 0.5
+RETRY_MAX_SECONDS = 30.0
+
+# Failures caused by the rows themselves rather than the database being unavailable;
+# batches failing this way are split to isolate the offending rows
+_ROW_ERRORS = (
+    asyncpg.exceptions.DataError,
+    asyncpg.exceptions.IntegrityConstraintViolationError,
+    sa_exc.DataError,
+    sa_exc.IntegrityError,
+    KeyError,  # a field that isn't a column of the target table
+    TypeError,
+    ValueError,
+)
+
+# Tables the batcher writes to, keyed by the tag stored with spilled events
+_MODELS: Dict[str, Type[Base]] = {
+    model.__tablename__: model for model in (AuditLog, LoginAttempt)
+}
+
+# Columns that must be restored to UUID / datetime when reading spilled events back
+_UUID_FIELDS = ("user_id", "resource_id", "clinic_id")
+_DATETIME_FIELDS = ("timestamp", "attempted_at")
+
+# A queued event: target model and its column values
+Entry = Tuple[Type[Base], Dict[str, Any]]
+
+
+def _jsonable(value: Any) -> Any:
+    """
+    Convert raw UUID, datetime and Enum values in event metadata to JSON types.
+    Runs at flush time so request handlers can enqueue values as-is.
+    """
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _copy_layout(model: Type[Base], rows: List[Dict[str, Any]]) -> Tuple[List[str], List[tuple]]:
+    """
+    Column names and record tuples for COPYing rows into a model's table.
+    Columns no row sets (id, created_at) are left out so their server defaults apply;
+    a row missing a column another row sets gets the column's Python default.
+    Strings longer than their varchar column are truncated, so one oversized
+    value (a long user agent, say) can't make COPY reject the whole batch.
+    """
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    columns: List[Column] = [model.__mapper__.columns[key] for key in keys]
+    defaults = [
+        column.default.arg if column.default is not None and column.default.is_scalar else None
+        for column in columns
+    ]
+    converters = [_copy_converter(column) for column in columns]
+    records = []
+    for row in rows:
+        values = (row.get(key, default) for key, default in zip(keys, defaults, strict=True))
+        records.append(tuple(
+            value if value is None else convert(value)
+            for value, convert in zip(values, converters, strict=True)
+        ))
+    return [column.name for column in columns], records
+
+
+def _copy_converter(column: Column) -> Callable[[Any], Any]:
+    """Per-column value preparation for COPY, which bypasses SQLAlchemy's type processing."""
+    if isinstance(column.type, JSONB):
+        return lambda value: json.dumps(value, default=str)
+    length = getattr(column.type, "length", None)
+    if isinstance(column.type, String) and length:
+        return lambda value: value[:length] if isinstance(value, str) else value
+    return lambda value: value
+
+
+class AuditLogBatcher:
+    """
+    Queue-backed audit log batcher.
+    Events are flushed every `batch_size` items or `batch_interval_ms`
+    milliseconds, whichever comes first. Events that cannot be queued or
+    written are spilled to Redis and replayed by the flush loop (with
+    exponential backoff while writes keep failing), so PHI access records are
+    never silently dropped. A batch the database rejects is split in halves
+    until the rejected rows are isolated; those go to a dead-letter list.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = settings.audit_batch_size,
+        batch_interval_ms: int = settings.audit_batch_interval_ms,
+        max_queue_size: int = settings.audit_queue_max_size,
+    ) -> None:
+        """
+        Initialize the batcher.
+
+        Args:
+            batch_size: Maximum number of events per INSERT
+            batch_interval_ms: Maximum time an event waits before being flushed
+            max_queue_size: Queue capacity before events spill to Redis
+        """
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval_ms / 1000
+        self._queue: asyncio.Queue[Entry] = asyncio.Queue(maxsize=max_queue_size)
+        self._task: Optional[asyncio.Task] = None
+        self._closing = False
+        self._has_spill = True  # Replay anything left over from a previous run
+        self._spill_tasks: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def start(self) -> None:
+        """Start the background flush loop. Call once from app startup."""
+        if self._task is None:
+            self._closing = False
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Flush every queued event and stop the background loop."""
+        self._closing = True
+        self._stopping.set()
+        if self._task:
+            await self._task
+            self._task = None
+        if self._spill_tasks:
+            await asyncio.gather(*self._spill_tasks, return_exceptions=True)
+
+    def enqueue(self, event: Dict[str, Any]) -> None:
+        """
+        Queue an audit event without waiting for the database write.
+
+        Args:
+            event: AuditLog column values (user_id, action, resource_type, ...).
+                Metadata may hold raw UUID, datetime and Enum values; they are
+                converted when the batch is flushed.
+        """
+        row = {"is_phi_access": True, "success": True, **event}
+        row.setdefault("timestamp", datetime.now(timezone.utc))
+        self._put(AuditLog, row)
+
+    def enqueue_action(
+        self,
+        user_id: Optional[UUID],
+        action: str,
+        resource_type: str,
+        resource_id: Optional[UUID] = None,
+        is_phi: bool = False,
+        **fields: Any
+    ) -> None:
+        """
+        Queue a general audit event (e.g. administrative changes).
+        Accepts the same arguments as AuditLogger.log_action.
+        """
+        self.enqueue({
+            "user_id": user_id,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "is_phi_access": is_phi,
+            **fields,
+        })
+
+    def enqueue_login_attempt(
+        self,
+        email: str,
+        user_id: Optional[UUID],
+        success: bool,
+        ip_address: str,
+        user_agent: Optional[str] = None,
+        failure_reason: Optional[str] = None,
+        mfa_used: bool = False,
+        mfa_success: Optional[bool] = None
+    ) -> None:
+        """
+        Queue a login attempt record.
+        Accepts the same arguments as AuditLogger.log_login_attempt.
+        """
+        self._put(LoginAttempt, {
+            "email": email,
+            "user_id": user_id,
+            "success": success,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "failure_reason": failure_reason,
+            "mfa_used": mfa_used,
+            "mfa_success": mfa_success,
+            "attempted_at": datetime.now(timezone.utc),
+        })
+
+    def _put(self, model: Type[Base], row: Dict[str, Any]) -> None:
+        """Queue a row, spilling to Redis if the queue is full."""
+        try:
+            self._queue.put_nowait((model, row))
+        except asyncio.QueueFull:
+            self._spill([(model, row)])
+
+    def enqueue_phi_access(
+        self,
+        user_id: Optional[UUID],
+        user_email: Optional[str],
+        user_role: Optional[str],
+        action: str,
+        resource_type: str,
+        resource_id: Optional[UUID],
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        clinic_id: Optional[UUID] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> None:
+        """
+        Queue a PHI access event.
+        Accepts the same arguments as AuditLogger.log_phi_access.
+        """
+        self.enqueue({
+            "user_id": user_id,
+            "user_email": user_email,
+            "user_role": user_role,
+            "action": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+            "clinic_id": clinic_id,
+            "metadata": metadata,
+            **fields,
+        })
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue in batches until stopped and the queue is empty."""
+        loop = asyncio.get_running_loop()
+        while not (self._closing and self._queue.empty()):
+            try:
+                await self._wait_for_retry()
+                batch = await self._next_batch()
+                if batch:
+                    await self._write(batch)
+                if self._has_spill and loop.time() >= self._retry_at:
+                    await self._replay_spill()
+            except Exception:
+                # The loop is the only writer; it must outlive any single failure
+                delay = self._record_failure()
+                logger.exception("Audit flush loop iteration failed; retrying in %.1fs", delay)
+
+    async def _wait_for_retry(self) -> None:
+        """Sleep out the current backoff; returns early once stopping, to flush what it can."""
+        delay = self._retry_at - asyncio.get_running_loop().time()
+        if delay > 0 and not self._closing:
+            try:
+                await asyncio.wait_for(self._stopping.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def _record_failure(self) -> float:
+        """Count a batch-wide failure and schedule the next attempt. Returns the delay."""
+        self._failures += 1
+        delay = min(RETRY_BASE_SECONDS * 2 ** (self._failures - 1), RETRY_MAX_SECONDS)
+        self._retry_at = asyncio.get_running_loop().time() + delay
+        return delay
+
+    async def _next_batch(self) -> List[Entry]:
+        """Collect up to `batch_size` events, waiting at most `batch_interval`."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.batch_interval
+        batch: List[Entry] = []
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    @staticmethod
+    def _serialize(entries: List[Entry]) -> List[Entry]:
+        """Make event metadata JSON-ready in place."""
+        for _, row in entries:
+            if row.get("metadata"):
+                row["metadata"] = _jsonable(row["metadata"])
+        return entries
+
+    async def _write(self, entries: List[Entry]) -> None:
+        """
+        Write a batch of events.
+        If the database rejects the batch, it is split in halves and each half
+        written separately; a single rejected event is dead-lettered. Any other
+        failure spills the batch for replay after a backoff.
+        """
+        self._serialize(entries)
+        try:
+            await self._copy(entries)
+        except _ROW_ERRORS as exc:
+            if len(entries) == 1:
+                await self._dead_letter(entries[0], exc)
+                return
+            middle = len(entries) // 2
+            await self._write(entries[:middle])
+            await self._write(entries[middle:])
+            return
+        except Exception:
+            delay = self._record_failure()
+            logger.warning(
+                "Failed to write %d audit events, spilling to Redis; retrying in %.1fs",
+                len(entries), delay, exc_info=self._failures == 1,
+            )
+            await self._spill_to_redis(entries)
+            return
+        self._failures = 0
+        self._retry_at = 0.0
+
+    async def _copy(self, entries: List[Entry]) -> None:
+        """COPY a batch of events into each table, in one transaction."""
+        rows_by_model: Dict[Type[Base], List[Dict[str, Any]]] = {}
+        for model, row in entries:
+            rows_by_model.setdefault(model, []).append(row)
+
+        async with AsyncSessionLocal() as session:
+            for model, rows in rows_by_model.items():
+                columns, records = _copy_layout(model, rows)
+                await copy_records(session, model.__tablename__, columns, records)
+            await session.commit()
+
+    async def _dead_letter(self, entry: Union[Entry, str], error: Exception) -> None:
+        """
+        Park an event that can't be written, with the reason, instead of replaying it.
+        `entry` is a queued event, or the raw payload of a spilled one that failed to decode.
+        """
+        if isinstance(entry, str):
+            description = "undecodable spilled"
+            payload = json.dumps({"_raw": entry, "_error": str(error)})
+        else:
+            model, row = entry
+            description = model.__tablename__
+            payload = json.dumps(
+                {"_table": model.__tablename__, "_error": str(error), **row}, default=str
+            )
+        logger.error(
+            "Audit event (%s) could not be written, moved to %s: %s",
+            description, DEAD_LETTER_KEY, error,
+        )
+        try:
+            await redis_client.rpush(DEAD_LETTER_KEY, payload)
+        except Exception:
+            logger.exception("Failed to dead-letter a rejected %s event", description)
+
+    def _spill(self, entries: List[Entry]) -> None:
+        """Schedule events to be pushed to Redis from a synchronous context."""
+        task = asyncio.create_task(self._spill_to_redis(entries))
+        self._spill_tasks.add(task)
+        task.add_done_callback(self._spill_tasks.discard)
+
+    async def _spill_to_redis(self, entries: List[Entry]) -> None:
+        """Push events to the Redis spill list for later replay."""
+        self._serialize(entries)
+        payload = (
+            json.dumps({"_table": model.__tablename__, **row}, default=str)
+            for model, row in entries
+        )
+        try:
+            await redis_client.rpush(SPILL_KEY, *payload)
+            self._has_spill = True
+        except Exception:
+            logger.exception("Failed to spill %d audit events to Redis", len(entries))
+
+    async def _replay_spill(self) -> None:
+        """Write one batch of spilled events back to PostgreSQL."""
+        try:
+            payload = await redis_client.lpop(SPILL_KEY, self.batch_size)
+        except Exception:
+            delay = self._record_failure()
+            logger.warning(
+                "Failed to read spilled audit events from Redis; retrying in %.1fs",
+                delay, exc_info=self._failures == 1,
+            )
+            return
+
+        if not payload:
+            self._has_spill = False
+            return
+
+        entries = []
+        for item in payload:
+            try:
+                entries.append(self._decode(item))
+            except (KeyError, TypeError, ValueError, AttributeError) as exc:
+                # Malformed JSON, an unknown table tag or a bad UUID / timestamp
+                await self._dead_letter(item, exc)
+        if entries:
+            await self._write(entries)
+
+    @staticmethod
+    def _decode(item: str) -> Entry:
+        """Restore a spilled event to its model and database-ready types."""
+        row = json.loads(item)
+        model = _MODELS[row.pop("_table", AuditLog.__tablename__)]
+        for field in _UUID_FIELDS:
+            if row.get(field):
+                row[field] = UUID(row[field])
+        for field in _DATETIME_FIELDS:
+            if row.get(field):
+                row[field] = datetime.fromisoformat(row[field])
+        return model, row
+
+
+# Global audit batcher instance
+audit_batcher = AuditLogBatcher()
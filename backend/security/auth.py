@@ -3,7 +3,12 @@ Authentication and authorization module.
 Handles JWT tokens, password hashing, MFA, and RBAC.
 """
 
-from datetime import datetime, timedelta
+import base64
+import binascii
+import hmac
+import secrets
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from uuid import UUID
 
@@ -15,21 +20,29 @@ from config import settings
 from models.user import UserRole
 
 
-# Password hashing context
+# Password hashing context: argon2 for new hashes; bcrypt hashes still verify and are upgraded on login
 pwd_context = CryptContext(
-    schemes=["bcrypt"],
+    schemes=["argon2", "bcrypt"],
     deprecated="auto",
+    argon2__time_cost=settings.password_argon2_time_cost,
+    argon2__memory_cost=settings.password_argon2_memory_cost,
+    argon2__parallelism=settings.password_argon2_parallelism,
+    argon2__digest_size=32,
     bcrypt__rounds=12  # Increased rounds for 2025 security standards
 )
 
 
+# Hash checked when a login email is unknown, so that path costs a full verify too
+DUMMY_PASSWORD_HASH = pwd_context.hash(secrets.token_urlsafe(32))
+
+
 class PasswordManager:
     """Manage password hashing and verification."""
     
     @staticmethod
     def hash_password(password: str) -> str:
         """
-        Hash a password using bcrypt.
+        Hash a password using argon2id.
         
         Args:
             password: Plain text password
@@ -91,10 +104,11 @@ class JWTManager:
         Returns:
             Encoded JWT token
         """
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
+            expire = now + timedelta(
                 minutes=settings.jwt_access_token_expire_minutes
             )
         
@@ -104,7 +118,8 @@ class JWTManager:
             "role": role.value if isinstance(role, UserRole) else role,
             "clinic_id": str(clinic_id) if clinic_id else None,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
+            "jti": secrets.token_urlsafe(16),
             "type": "access"
         }
         
@@ -132,10 +147,11 @@ class JWTManager:
         Returns:
             Encoded JWT refresh token
         """
+        now = datetime.now(timezone.utc)
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            expire = now + expires_delta
         else:
-            expire = datetime.utcnow() + timedelta(
+            expire = now + timedelta(
                 days=settings.jwt_refresh_token_expire_days
             )
         
@@ -143,7 +159,7 @@ class JWTManager:
             "sub": str(user_id),
             "email": email,
             "exp": expire,
-            "iat": datetime.utcnow(),
+            "iat": now,
             "type": "refresh"
         }
         
@@ -199,6 +215,11 @@ class JWTManager:
             return None
 
 
+# TOTP parameters (RFC 6238 defaults used by authenticator apps)
+TOTP_INTERVAL_SECONDS = 30
+TOTP_DIGITS = 6
+
+
 class MFAManager:
     """Manage Multi-Factor Authentication (Time-based OTP)."""
     
@@ -244,8 +265,28 @@ class MFAManager:
         Returns:
             True if token is valid, False otherwise
         """
-        totp = pyotp.TOTP(secret)
-        return totp.verify(token, valid_window=1)  # Allow 1 time step tolerance
+        # Malformed codes are rejected before any HMAC work
+        if len(token) != TOTP_DIGITS or not (token.isascii() and token.isdigit()):
+            return False
+
+        try:
+            key = base64.b32decode(secret.upper() + "=" * (-len(secret) % 8))
+        except (binascii.Error, ValueError):
+            return False
+
+        # Check the current step and 1 step either side, without short-circuiting
+        counter = int(time.time()) // TOTP_INTERVAL_SECONDS
+        valid = False
+        for step in (counter - 1, counter, counter + 1):
+            digest = hmac.digest(key, step.to_bytes(8, "big"), "sha1")
+            offset = digest[-1] & 0x0F
+            code = (int.from_bytes(digest[offset:offset + 4], "big") & 0x7FFFFFFF) % 10 ** TOTP_DIGITS
+            valid |= hmac.compare_digest(f"{code:0{TOTP_DIGITS}d}", token)
+        return valid
+
+
+# Fallback permission set for roles missing from the matrix
+_NO_PERMISSIONS: frozenset[tuple[str, str]] = frozenset()
 
 
 class RBACManager:
@@ -290,8 +331,18 @@ class RBACManager:
         },
     }
     
-    @staticmethod
-    def has_permission(role: UserRole, resource: str, action: str) -> bool:
+    def __init__(self) -> None:
+        """Flatten ROLE_PERMISSIONS into per-role sets of (resource, action)."""
+        self._matrix: Dict[UserRole, frozenset[tuple[str, str]]] = {
+            role: frozenset(
+                (resource, action)
+                for resource, actions in permissions.items()
+                for action in actions
+            )
+            for role, permissions in self.ROLE_PERMISSIONS.items()
+        }
+    
+    def has_permission(self, role: UserRole, resource: str, action: str) -> bool:
         """
         Check if role has permission for action on resource.
         
@@ -303,9 +354,7 @@ class RBACManager:
         Returns:
             True if user has permission, False otherwise
         """
-        permissions = RBACManager.ROLE_PERMISSIONS.get(role, {})
-        resource_permissions = permissions.get(resource, [])
-        return action in resource_permissions
+        return (resource, action) in self._matrix.get(role, _NO_PERMISSIONS)
     
     @staticmethod
     def can_access_clinic(user_clinic_id: Optional[UUID], resource_clinic_id: UUID) -> bool:
@@ -0,0 +1,52 @@
+"""
+Failed login throttling.
+Counts failed logins per client IP in Redis so password guessing is capped
+before any password hash is verified.
+"""
+
+import logging
+
+from redis.exceptions import RedisError
+
+from config import settings
+from database.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+LOGIN_FAILURE_PREFIX = "auth:login_failures:"
+
+
+async def is_login_blocked(ip_address: str) -> bool:
+    """
+    Check whether an IP has exhausted its failed login budget.
+
+    Args:
+        ip_address: Client IP address
+
+    Returns:
+        True if further login attempts should be rejected
+    """
+    try:
+        failures = await redis_client.get(f"{LOGIN_FAILURE_PREFIX}{ip_address}")
+    except RedisError:
+        logger.warning("Login throttle lookup failed", exc_info=True)
+        return False
+
+    return failures is not None and int(failures) >= settings.login_failure_limit
+
+
+async def record_login_failure(ip_address: str) -> None:
+    """
+    Count a failed login for an IP within the throttle window.
+
+    Args:
+        ip_address: Client IP address
+    """
+    key = f"{LOGIN_FAILURE_PREFIX}{ip_address}"
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            pipe.expire(key, settings.login_failure_window_seconds, nx=True)
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Login throttle update failed", exc_info=True)
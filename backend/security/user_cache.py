@@ -0,0 +1,180 @@
+"""
+Caches for authenticated users and the revoked-token set.
+Lets get_current_user skip token verification and the user lookup while a token is live.
+Entries are keyed by token and not invalidated when a user changes: a role, clinic
+or active-status change reaches live tokens within auth_user_cache_ttl_seconds plus
+auth_token_cache_ttl_seconds. Logout (revoke_token) takes effect immediately.
+"""
+
+import hashlib
+import logging
+from time import time
+from typing import Optional, Tuple
+from uuid import UUID
+
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict
+from redis.exceptions import RedisError
+
+from config import settings
+from database.redis_client import redis_client
+from models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_PREFIX = "auth:user:"
+REVOKED_TOKEN_PREFIX = "bl:"
+
+
+class CachedUser(BaseModel):
+    """Subset of User fields needed by request handlers."""
+
+    id: UUID
+    email: str
+    first_name: str
+    last_name: str
+    role: UserRole
+    clinic_id: Optional[UUID] = None
+    is_active: bool
+    mfa_enabled: bool = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+    def to_user(self) -> User:
+        """Build a detached User instance from the cached fields."""
+        return User(**self.model_dump())
+
+
+# Per-worker cache of verified tokens: sha256(token) -> (exp, jti, user)
+_verified_tokens: TTLCache = TTLCache(
+    maxsize=settings.auth_token_cache_size,
+    ttl=settings.auth_token_cache_ttl_seconds,
+)
+
+
+def _token_key(token: str) -> bytes:
+    """Hash a raw token so bearer secrets are never held as cache keys."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+def get_verified_token(token: str) -> Optional[Tuple[Optional[str], CachedUser]]:
+    """
+    Get the user for a token this worker has already verified.
+
+    Args:
+        token: Raw bearer token
+
+    Returns:
+        (jti, user) if the token was verified recently and has not expired
+    """
+    entry: Optional[Tuple[int, Optional[str], CachedUser]] = _verified_tokens.get(_token_key(token))
+    if entry is None or entry[0] <= time():
+        return None
+    return entry[1], entry[2]
+
+
+def remember_verified_token(
+    token: str,
+    user: CachedUser,
+    token_exp: int,
+    jti: Optional[str] = None
+) -> None:
+    """
+    Remember a verified token and its user in this worker.
+
+    Args:
+        token: Raw bearer token
+        user: Authenticated user
+        token_exp: Token expiry as a Unix timestamp
+        jti: Token identifier claim, used for revocation checks
+    """
+    _verified_tokens[_token_key(token)] = (token_exp, jti, user)
+
+
+def forget_verified_token(token: str) -> None:
+    """
+    Drop a token from this worker's verified-token cache.
+
+    Args:
+        token: Raw bearer token
+    """
+    _verified_tokens.pop(_token_key(token), None)
+
+
+async def get_token_state(jti: str) -> Tuple[bool, Optional[CachedUser]]:
+    """
+    Check revocation and fetch the cached user for a token in one Redis round trip.
+
+    Args:
+        jti: Token identifier claim
+
+    Returns:
+        (revoked, cached user); (False, None) on Redis failure
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.exists(f"{REVOKED_TOKEN_PREFIX}{jti}")
+            pipe.get(f"{USER_CACHE_PREFIX}{jti}")
+            revoked, cached = await pipe.execute()
+    except RedisError:
+        logger.warning("Token state lookup failed", exc_info=True)
+        return False, None
+
+    if revoked:
+        return True, None
+    if cached is None:
+        return False, None
+    return False, CachedUser.model_validate_json(cached)
+
+
+async def is_token_revoked(jti: str) -> bool:
+    """
+    Check whether a token has been revoked (e.g. by logout).
+
+    Args:
+        jti: Token identifier claim
+
+    Returns:
+        True if revoked; False when not revoked or on Redis failure
+    """
+    try:
+        return bool(await redis_client.exists(f"{REVOKED_TOKEN_PREFIX}{jti}"))
+    except RedisError:
+        logger.warning("Token revocation lookup failed", exc_info=True)
+        return False
+
+
+async def cache_user(jti: str, user: CachedUser, token_exp: int) -> None:
+    """
+    Cache a user in Redis for the remaining lifetime of its token.
+
+    Args:
+        jti: Token identifier claim
+        user: Authenticated user
+        token_exp: Token expiry as a Unix timestamp
+    """
+    ttl = min(int(token_exp - time()), settings.auth_user_cache_ttl_seconds)
+    if ttl <= 0:
+        return
+
+    try:
+        await redis_client.setex(f"{USER_CACHE_PREFIX}{jti}", ttl, user.model_dump_json())
+    except RedisError:
+        logger.warning("User cache write failed", exc_info=True)
+
+
+async def revoke_token(jti: str, token_exp: int) -> None:
+    """
+    Revoke a token until it expires and drop its cached user.
+
+    Args:
+        jti: Token identifier claim
+        token_exp: Token expiry as a Unix timestamp
+    """
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(f"{REVOKED_TOKEN_PREFIX}{jti}", "1", exat=token_exp)
+            pipe.delete(f"{USER_CACHE_PREFIX}{jti}")
+            await pipe.execute()
+    except RedisError:
+        logger.warning("Token revocation failed", exc_info=True)